@@ -1,8 +1,15 @@
 #v3
 
+# Generated engine from tools/engine.py.in by python -m tools.generate; edit tools/engine.py.in, not this block
 from __future__ import annotations
 
-from typing import List, Set
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Tuple
+
+from collections.abc import Sequence
+from functools import cache, cached_property
+from operator import itemgetter
+from sys import intern
+from weakref import WeakValueDictionary
 
 from dataclasses import dataclass
 
@@ -13,8 +20,88 @@ from ..game_objective_template import GameObjectiveTemplate
 
 from ..enums import KeymastersKeepGamePlatforms
 
-@dataclass
+# Every catalog the game class declares, by name, for the objective rows to look up
+_catalogs: Dict[str, Callable] = {}
+
+def _catalog(name: str, builder: Callable, *arguments: Any) -> staticmethod:
+    # The catalog the game class declares as name: built from the arguments on first use, then the same frozen
+    # sequence for every caller
+    built = []
+    
+    def catalog() -> Sequence[Any]:
+        if not built:
+            built.append(builder(*arguments))
+        return built[0]
+    
+    catalog.__name__ = catalog.__qualname__ = name
+    _catalogs[name] = catalog
+    return staticmethod(catalog)
+
+def _names(names: str) -> Tuple[str, ...]:
+    # Interned, so every game module loaded in the process shares one copy of each name
+    return tuple(map(intern, names.split("|")))
+
+def _pairs(entries: str) -> Iterator[List[str]]:
+    # Each "key=value" entry of a "|"-separated string
+    return (entry.split("=") for entry in entries.split("|"))
+
+def _key_bits(keys: Sequence[str], chosen: FrozenSet[str]) -> int:
+    # One bit per key of an option set, in order, for the keys chosen
+    return sum(1 << bit for bit, key in enumerate(keys) if key in chosen)
+
+@cache
+def _row_template(index: int) -> GameObjectiveTemplate:
+    # The flyweight every options fingerprint enabling the row's section shares
+    _, label, data, is_time_consuming, is_difficult, weight, _ = _objective_rows[index].split(";")
+    return GameObjectiveTemplate(
+        label = intern(label),
+        data = {placeholder: (_catalogs[catalog], 1) for placeholder, catalog in _pairs(data)},
+        is_time_consuming = is_time_consuming == "1",
+        is_difficult = is_difficult == "1",
+        weight = int(weight)
+    )
+
+class TemplateSet:
+    """
+    The objective templates one options fingerprint enables, in row order, shared by every game instance with those
+    options. Each selection by difficulty is kept once it is asked for
+    """
+    def __init__(self, flags: int, rows: Tuple[int, ...]) -> None:
+        self.flags = flags
+        self.rows = rows
+        self.templates = tuple(map(_row_template, rows))
+        self.selections = {}
+    
+    def filter(self, include_difficult: bool, include_time_consuming: bool) -> Tuple[GameObjectiveTemplate, ...]:
+        key = include_difficult, include_time_consuming
+        templates = self.selections.get(key)
+        if templates is None:
+            templates = self.selections[key] = tuple(
+                template for template in self.templates
+                if (include_difficult or not template.is_difficult)
+                and (include_time_consuming or not template.is_time_consuming)
+            )
+        return templates
+
+# Held weakly, so each options fingerprint's templates live only while a game instance uses them
+_template_sets: WeakValueDictionary[int, TemplateSet] = WeakValueDictionary()
+
+def _template_set(flags: int) -> TemplateSet:
+    template_set = _template_sets.get(flags)
+    if template_set is None:
+        # A row's section is the text before its first ";"
+        template_set = _template_sets[flags] = TemplateSet(flags, tuple(
+            index for index, row in enumerate(_objective_rows) if flags >> _sections.index(row.partition(";")[0]) & 1
+        ))
+    return template_set
+# End of generated engine
+
+# Generated options from tools/games.json by python -m tools.generate; edit the specification, not this block
+@dataclass(init = False, repr = False, eq = False)
 class GT1APOptions:
+    """
+    The options GT1 adds to Keymaster's Keep
+    """
     gran_turismo_include_arcade_mode: GT1IncludeArcadeMode
     gran_turismo_include_career_mode: GT1IncludeCareerMode
     gran_turismo_career_sections: GT1CareerSections
@@ -44,6 +131,38 @@ class GT1CareerSections(OptionSet):
     valid_keys = ["Licenses", "GT League", "Special Events", "Spot Races", "Endurance"]
     default = valid_keys
 
+class GT1OptionsPlan(tuple):
+    """
+    The player's options for this game, resolved once so objective generation never walks the options again.
+    Immutable, so the flags worked out as it is made always match the options
+    """
+    __slots__ = ()
+    
+    def __new__(cls, options: GT1APOptions) -> GT1OptionsPlan:
+        include_arcade_mode = bool(options.gran_turismo_include_arcade_mode.value)
+        include_career_mode = bool(options.gran_turismo_include_career_mode.value)
+        career_sections = frozenset(options.gran_turismo_career_sections.value)
+        # One bit per entry in _sections, in the same order. Settings switched off by a mode toggle are left
+        # out, so equivalent plans share a key
+        flags = (
+            include_arcade_mode |
+            include_career_mode << 1 |
+            (_key_bits(GT1CareerSections.valid_keys, career_sections) << 2 if include_career_mode else 0)
+        )
+        return tuple.__new__(cls, (include_arcade_mode, include_career_mode, career_sections, flags))
+    
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Copies and pickles are made from the fields, as the options are not kept
+        return tuple.__new__, (type(self), tuple(self))
+    
+    include_arcade_mode = property(itemgetter(0))
+    include_career_mode = property(itemgetter(1))
+    career_sections = property(itemgetter(2))
+    flags = property(itemgetter(3))
+
+_sections: Tuple[str, ...] = ("Arcade Mode", "Gran Turismo Mode", *GT1CareerSections.valid_keys)
+# End of generated options
+
 class GranTurismo(Game):
     """
     The best-selling Playstation game of all time, Gran Turismo fundamentally
@@ -58,213 +177,82 @@ class GranTurismo(Game):
     is_adult_only_or_unrated = False
     options_cls = GT1APOptions
     
+    # Generated members from tools/games.json by python -m tools.generate; edit the specification, not this block
+    @cached_property
+    def options_plan(self) -> GT1OptionsPlan:
+        return GT1OptionsPlan(self.archipelago_options)
+    
     @property
     def include_arcade_mode(self) -> bool:
-        return bool(self.archipelago_options.gran_turismo_include_arcade_mode.value)
+        return self.options_plan.include_arcade_mode
     
     @property
     def include_career_mode(self) -> bool:
-        return bool(self.archipelago_options.gran_turismo_include_career_mode.value)
-    
-    @property
-    def career_sections(self) -> Set[str]:
-        return self.archipelago_options.gran_turismo_career_sections.value
+        return self.options_plan.include_career_mode
     
     @property
-    def include_licence_tests(self) -> bool:
-        return "Licenses" in self.career_sections
+    def career_sections(self) -> FrozenSet[str]:
+        return self.options_plan.career_sections
     
-    @property
-    def include_gt_league(self) -> bool:
-        return "GT League" in self.career_sections
-    
-    @property
-    def include_special_events(self) -> bool:
-        return "Special Events" in self.career_sections
-    
-    @property
-    def include_spot_races(self) -> bool:
-        return "Spot Races" in self.career_sections
-    
-    @property
-    def include_endurances(self) -> bool:
-        return "Endurance" in self.career_sections
-    
-    def arcade_classes(self) -> List[str]:
-        return ["C", "B", "A"]
-    
-    def arcade_ranks(self) -> List[str]:
-        return ["Easy", "Normal"]
-    
-    def arcade_hard_ranks(self) -> List[str]:
-        return ["Hard"]
-    
-    def arcade_tracks(self) -> List[str]:
-        return [
-            "High Speed Ring", "Trial Mountain Circuit", "Grand Valley East", "Clubman Stage Route 5",
-            "Autumn Ring", "Deep Forest", "Special Stage Route 5", "Grand Valley Speedway"
-         ]
-    
-    def licence_tests(self) -> List[str]:
-        return [f"{l}-{n}" for l in ["B", "A", "IA"] for n in range(1, 9)]
-    
-    def gt_league(self) -> List[str]:
-        return ["Sunday Cup", "Clubman Cup", "Gran Turismo Cup", "Gran Turismo World Cup"]
-    
-    def special_events(self) -> List[str]:
-        return [
-            "FF Challenge", "FR Challenge", "4WD Challenge", "Lightweight Sports Battle Stage",
-            "US-Japan Sports Car Championship", "Anglo-Japanese Sports Car Championship", "Anglo-American Sports Car Championship",
-            "Megaspeed Cup", "Normal Car World Speed Contest", "Hard-Tuned Car Speed Contest"
-        ]
-    
-    def spot_race_tracks(self) -> List[str]:
-        return ["High Speed Ring", "Grand Valley East", "Autumn Ring Mini", "Trial Mountain Circuit", "Deep Forest"]
-    
-    def endurances(self) -> List[str]:
-        return ["Grand Valley 300km", "Special Stage Route 11 All-Night 1", "Special Stage Route 11 All-Night 2"]
+    arcade_classes = _catalog("arcade_classes", _names, "C|B|A")
+    arcade_ranks = _catalog("arcade_ranks", _names, "Easy|Normal")
+    arcade_hard_ranks = _catalog("arcade_hard_ranks", _names, "Hard")
+    arcade_tracks = _catalog("arcade_tracks", _names, (
+        "High Speed Ring|Trial Mountain Circuit|Grand Valley East|Clubman Stage Route 5|Autumn Ring|Deep Forest|"
+        "Special Stage Route 5|Grand Valley Speedway"
+    ))
+    licence_tests = _catalog("licence_tests", _names, (
+        "B-1|B-2|B-3|B-4|B-5|B-6|B-7|B-8|A-1|A-2|A-3|A-4|A-5|A-6|A-7|A-8|IA-1|IA-2|IA-3|IA-4|IA-5|IA-6|IA-7|IA-8"
+    ))
+    gt_league = _catalog("gt_league", _names, "Sunday Cup|Clubman Cup|Gran Turismo Cup|Gran Turismo World Cup")
+    special_events = _catalog("special_events", _names, (
+        "FF Challenge|FR Challenge|4WD Challenge|Lightweight Sports Battle Stage|US-Japan Sports Car Championship|"
+        "Anglo-Japanese Sports Car Championship|Anglo-American Sports Car Championship|Megaspeed Cup|"
+        "Normal Car World Speed Contest|Hard-Tuned Car Speed Contest"
+    ))
+    spot_race_tracks = _catalog("spot_race_tracks", _names, (
+        "High Speed Ring|Grand Valley East|Autumn Ring Mini|Trial Mountain Circuit|Deep Forest"
+    ))
+    endurances = _catalog("endurances", _names, (
+        "Grand Valley 300km|Special Stage Route 11 All-Night 1|Special Stage Route 11 All-Night 2"
+    ))
     
     def optional_game_constraint_templates(self) -> List[GameObjectiveTemplate]:
         return []
     
     def game_objective_templates(self) -> List[GameObjectiveTemplate]:
-        return self.get_arcade_objectives() + self.get_career_objectives()
-    
-    def get_arcade_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium at TRACK in Class CLASS at RANK level or higher in Arcade Mode!",
-                data = {
-                    "CLASS": (self.arcade_classes, 1),
-                    "RANK": (self.arcade_ranks, 1),
-                    "TRACK": (self.arcade_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the race at TRACK in Class CLASS at RANK level or higher in Arcade Mode!",
-                data = {
-                    "CLASS": (self.arcade_classes, 1),
-                    "RANK": (self.arcade_ranks, 1),
-                    "TRACK": (self.arcade_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Stand on the podium at TRACK in Class CLASS at RANK level in Arcade Mode!",
-                data = {
-                    "CLASS": (self.arcade_classes, 1),
-                    "RANK": (self.arcade_hard_ranks, 1),
-                    "TRACK": (self.arcade_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the race at TRACK in Class CLASS at RANK level in Arcade Mode!",
-                data = {
-                    "CLASS": (self.arcade_classes, 1),
-                    "RANK": (self.arcade_hard_ranks, 1),
-                    "TRACK": (self.arcade_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            )
-        ] if self.include_arcade_mode else []
-    
-    def get_career_objectives(self) -> List[GameObjectiveTemplate]:
-        return (self.get_licence_objectives() +
-                self.get_league_objectives() +
-                self.get_event_objectives() +
-                self.get_spot_race_objectives() +
-                self.get_endurance_objectives()
-                if self.include_career_mode else [])
-    
-    def get_licence_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Beat the target time in licence test LICENCE!",
-                data = {
-                    "LICENCE": (self.licence_tests, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Get the Gold Medal in licence test LICENCE!",
-                data = {
-                    "LICENCE": (self.licence_tests, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            )
-        ] if self.include_licence_tests else []
+        return list(self.template_set.templates)
     
-    def get_league_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Become the LEAGUE Champion!",
-                data = {
-                    "LEAGUE": (self.gt_league, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_gt_league else []
-    
-    def get_event_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Become the EVENT Champion!",
-                data = {
-                    "EVENT": (self.special_events, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_special_events else []
+    def filter_game_objective_templates(
+        self,
+        include_difficult: bool = False,
+        include_time_consuming: bool = False
+    ) -> List[GameObjectiveTemplate]:
+        return list(self.template_set.filter(include_difficult, include_time_consuming))
     
-    def get_spot_race_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium in a Spot Race at TRACK!",
-                data = {
-                    "TRACK": (self.spot_race_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win a Spot Race at TRACK!",
-                data = {
-                    "TRACK": (self.spot_race_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_spot_races else []
-    
-    def get_endurance_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Win the EVENT!",
-                data = {
-                    "EVENT": (self.endurances, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_endurances else []
\ No newline at end of file
+    @cached_property
+    def template_set(self) -> TemplateSet:
+        return _template_set(self.options_plan.flags)
+    # End of generated members
+
+# Generated rows from tools/games.json by python -m tools.generate; edit the specification, not this block
+# Each row, split by ";": the section enabling it, its label, the PLACEHOLDER=catalog it fills,
+# is_time_consuming and is_difficult as 1 or 0, its weight and its conflict key, if any
+_objective_rows: Tuple[str, ...] = (
+    "Arcade Mode;Stand on the podium at TRACK in Class CLASS at RANK level or higher in Arcade Mode!;"
+    "CLASS=arcade_classes|RANK=arcade_ranks|TRACK=arcade_tracks;0;0;3;arcade_race",
+    "Arcade Mode;Win the race at TRACK in Class CLASS at RANK level or higher in Arcade Mode!;"
+    "CLASS=arcade_classes|RANK=arcade_ranks|TRACK=arcade_tracks;0;0;3;arcade_race",
+    "Arcade Mode;Stand on the podium at TRACK in Class CLASS at RANK level in Arcade Mode!;"
+    "CLASS=arcade_classes|RANK=arcade_hard_ranks|TRACK=arcade_tracks;0;1;3;arcade_hard_race",
+    "Arcade Mode;Win the race at TRACK in Class CLASS at RANK level in Arcade Mode!;"
+    "CLASS=arcade_classes|RANK=arcade_hard_ranks|TRACK=arcade_tracks;0;1;3;arcade_hard_race",
+    "Licenses;Beat the target time in licence test LICENCE!;LICENCE=licence_tests;0;0;3;licence_test",
+    "Licenses;Get the Gold Medal in licence test LICENCE!;LICENCE=licence_tests;0;1;3;licence_test",
+    "GT League;Become the LEAGUE Champion!;LEAGUE=gt_league;1;0;3;",
+    "Special Events;Become the EVENT Champion!;EVENT=special_events;1;0;3;",
+    "Spot Races;Stand on the podium in a Spot Race at TRACK!;TRACK=spot_race_tracks;0;0;3;spot_race",
+    "Spot Races;Win a Spot Race at TRACK!;TRACK=spot_race_tracks;0;0;3;spot_race",
+    "Endurance;Win the EVENT!;EVENT=endurances;1;0;3;"
+)
+# End of generated rows
\ No newline at end of file
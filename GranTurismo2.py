@@ -1,8 +1,17 @@
 #v3
 
+# Generated engine from tools/engine.py.in by python -m tools.generate; edit tools/engine.py.in, not this block
 from __future__ import annotations
 
-from typing import List, Set
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Tuple
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from functools import cache, cached_property
+from itertools import accumulate
+from operator import itemgetter
+from sys import intern
+from weakref import WeakValueDictionary
 
 from dataclasses import dataclass
 
@@ -13,8 +22,128 @@ from ..game_objective_template import GameObjectiveTemplate
 
 from ..enums import KeymastersKeepGamePlatforms
 
-@dataclass
+# Every catalog the game class declares, by name, for the objective rows to look up
+_catalogs: Dict[str, Callable] = {}
+
+def _catalog(name: str, builder: Callable, *arguments: Any) -> staticmethod:
+    # The catalog the game class declares as name: built from the arguments on first use, then the same frozen
+    # sequence for every caller
+    built = []
+    
+    def catalog() -> Sequence[Any]:
+        if not built:
+            built.append(builder(*arguments))
+        return built[0]
+    
+    catalog.__name__ = catalog.__qualname__ = name
+    _catalogs[name] = catalog
+    return staticmethod(catalog)
+
+def _names(names: str) -> Tuple[str, ...]:
+    # Interned, so every game module loaded in the process shares one copy of each name
+    return tuple(map(intern, names.split("|")))
+
+def _pairs(entries: str) -> Iterator[List[str]]:
+    # Each "key=value" entry of a "|"-separated string
+    return (entry.split("=") for entry in entries.split("|"))
+
+class Race(tuple):
+    """
+    One race of a series as (game, section, series, number), only formatted as a label when it is shown. Named fields
+    like a NamedTuple, without the class creation a NamedTuple costs at import
+    """
+    __slots__ = ()
+    
+    game = property(itemgetter(0))
+    section = property(itemgetter(1))
+    series = property(itemgetter(2))
+    number = property(itemgetter(3))
+    
+    def __str__(self) -> str:
+        return f"{self.series} Race {self.number}"
+
+class SeriesRaces(Sequence):
+    """
+    Every race of a group of series, numbered within each series and only built when a race is looked up
+    """
+    __slots__ = ("game", "section", "series", "starts")
+    
+    def __init__(self, game: str, section: str, race_counts: str) -> None:
+        series, counts = zip(*_pairs(race_counts))
+        self.game = game
+        self.section = section
+        self.series = tuple(map(intern, series))
+        # Where each series starts, then the number of races in all of them
+        self.starts = (0, *accumulate(map(int, counts)))
+    
+    def __len__(self) -> int:
+        return self.starts[-1]
+    
+    def __getitem__(self, index: int) -> Race:
+        if index < 0:
+            index += self.starts[-1]
+        if not 0 <= index < self.starts[-1]:
+            raise IndexError("race index out of range")
+        position = bisect_right(self.starts, index) - 1
+        return Race((self.game, self.section, self.series[position], index - self.starts[position] + 1))
+
+def _key_bits(keys: Sequence[str], chosen: FrozenSet[str]) -> int:
+    # One bit per key of an option set, in order, for the keys chosen
+    return sum(1 << bit for bit, key in enumerate(keys) if key in chosen)
+
+@cache
+def _row_template(index: int) -> GameObjectiveTemplate:
+    # The flyweight every options fingerprint enabling the row's section shares
+    _, label, data, is_time_consuming, is_difficult, weight, _ = _objective_rows[index].split(";")
+    return GameObjectiveTemplate(
+        label = intern(label),
+        data = {placeholder: (_catalogs[catalog], 1) for placeholder, catalog in _pairs(data)},
+        is_time_consuming = is_time_consuming == "1",
+        is_difficult = is_difficult == "1",
+        weight = int(weight)
+    )
+
+class TemplateSet:
+    """
+    The objective templates one options fingerprint enables, in row order, shared by every game instance with those
+    options. Each selection by difficulty is kept once it is asked for
+    """
+    def __init__(self, flags: int, rows: Tuple[int, ...]) -> None:
+        self.flags = flags
+        self.rows = rows
+        self.templates = tuple(map(_row_template, rows))
+        self.selections = {}
+    
+    def filter(self, include_difficult: bool, include_time_consuming: bool) -> Tuple[GameObjectiveTemplate, ...]:
+        key = include_difficult, include_time_consuming
+        templates = self.selections.get(key)
+        if templates is None:
+            templates = self.selections[key] = tuple(
+                template for template in self.templates
+                if (include_difficult or not template.is_difficult)
+                and (include_time_consuming or not template.is_time_consuming)
+            )
+        return templates
+
+# Held weakly, so each options fingerprint's templates live only while a game instance uses them
+_template_sets: WeakValueDictionary[int, TemplateSet] = WeakValueDictionary()
+
+def _template_set(flags: int) -> TemplateSet:
+    template_set = _template_sets.get(flags)
+    if template_set is None:
+        # A row's section is the text before its first ";"
+        template_set = _template_sets[flags] = TemplateSet(flags, tuple(
+            index for index, row in enumerate(_objective_rows) if flags >> _sections.index(row.partition(";")[0]) & 1
+        ))
+    return template_set
+# End of generated engine
+
+# Generated options from tools/games.json by python -m tools.generate; edit the specification, not this block
+@dataclass(init = False, repr = False, eq = False)
 class GT2APOptions:
+    """
+    The options GT2 adds to Keymaster's Keep
+    """
     gran_turismo_2_include_arcade_mode: GT2IncludeArcadeMode
     gran_turismo_2_include_career_mode: GT2IncludeCareerMode
     gran_turismo_2_career_sections: GT2CareerSections
@@ -43,9 +172,44 @@ class GT2CareerSections(OptionSet):
     - Endurance
     """
     display_name = "Gran Turismo Mode Objective Areas"
-    valid_keys = ["Licenses", "Gran Turismo League", "Special Events", "Dirt Events", "Manufacturer Events", "Event Generator", "Endurance"]
+    valid_keys = [
+        "Licenses", "Gran Turismo League", "Special Events", "Dirt Events", "Manufacturer Events", "Event Generator",
+        "Endurance"
+    ]
     default = valid_keys
 
+class GT2OptionsPlan(tuple):
+    """
+    The player's options for this game, resolved once so objective generation never walks the options again.
+    Immutable, so the flags worked out as it is made always match the options
+    """
+    __slots__ = ()
+    
+    def __new__(cls, options: GT2APOptions) -> GT2OptionsPlan:
+        include_arcade_mode = bool(options.gran_turismo_2_include_arcade_mode.value)
+        include_career_mode = bool(options.gran_turismo_2_include_career_mode.value)
+        career_sections = frozenset(options.gran_turismo_2_career_sections.value)
+        # One bit per entry in _sections, in the same order. Settings switched off by a mode toggle are left
+        # out, so equivalent plans share a key
+        flags = (
+            include_arcade_mode |
+            include_career_mode << 1 |
+            (_key_bits(GT2CareerSections.valid_keys, career_sections) << 2 if include_career_mode else 0)
+        )
+        return tuple.__new__(cls, (include_arcade_mode, include_career_mode, career_sections, flags))
+    
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Copies and pickles are made from the fields, as the options are not kept
+        return tuple.__new__, (type(self), tuple(self))
+    
+    include_arcade_mode = property(itemgetter(0))
+    include_career_mode = property(itemgetter(1))
+    career_sections = property(itemgetter(2))
+    flags = property(itemgetter(3))
+
+_sections: Tuple[str, ...] = ("Arcade Mode", "Gran Turismo Mode", *GT2CareerSections.valid_keys)
+# End of generated options
+
 class GranTurismo2(Game):
     """
     After the phenomenal success of Gran Turismo, a sequel was inevitable,
@@ -64,425 +228,129 @@ class GranTurismo2(Game):
     is_adult_only_or_unrated = False
     options_cls = GT2APOptions
     
+    # Generated members from tools/games.json by python -m tools.generate; edit the specification, not this block
+    @cached_property
+    def options_plan(self) -> GT2OptionsPlan:
+        return GT2OptionsPlan(self.archipelago_options)
+    
     @property
     def include_arcade_mode(self) -> bool:
-        return bool(self.archipelago_options.gran_turismo_2_include_arcade_mode.value)
+        return self.options_plan.include_arcade_mode
     
     @property
     def include_career_mode(self) -> bool:
-        return bool(self.archipelago_options.gran_turismo_2_include_career_mode.value)
-    
-    @property
-    def career_sections(self) -> Set[str]:
-        return self.archipelago_options.gran_turismo_2_career_sections.value
-    
-    @property
-    def include_licence_tests(self) -> bool:
-        return "Licenses" in self.career_sections
-    
-    @property
-    def include_gt_league(self) -> bool:
-        return "Gran Turismo League" in self.career_sections
-    
-    @property
-    def include_special_events(self) -> bool:
-        return "Special Events" in self.career_sections
-    
-    @property
-    def include_rally_events(self) -> bool:
-        return "Dirt Events" in self.career_sections
-    
-    @property
-    def include_maker_events(self) -> bool:
-        return "Manufacturer Events" in self.career_sections
-    
-    @property
-    def include_event_synth(self) -> bool:
-        return "Event Generator" in self.career_sections
+        return self.options_plan.include_career_mode
     
     @property
-    def include_endurances(self) -> bool:
-        return "Endurance" in self.career_sections
-    
-    def arcade_classes(self) -> List[str]:
-        return ["C", "B", "A", "S"]
-    
-    def arcade_ranks(self) -> List[str]:
-        return ["Easy", "Normal"]
-    
-    def arcade_hard_ranks(self) -> List[str]:
-        return ["Difficult"]
-    
-    def arcade_tarmac_tracks(self) -> List[str]:
-        return [
-            "Tahiti Road", "Midfield Raceway", "High Speed Ring",
-            "Super Speedway", "Seattle Short Course", "Rome Short Course",
-            "Red Rock Valley Speedway", "Seattle Circuit", "Rome Circuit",
-            "Grindelwald", "Laguna Seca Raceway", "Apricot Hill Speedway",
-            "Trial Mountain Circuit", "Clubman Stage Route 5", "Grand Valley East Section",
-            "Grand Valley Speedway", "Special Stage Route 5", "Autumn Ring",
-            "Test Course", "Deep Forest Raceway", "Rome Night"
-        ]
-    
-    def licence_tests(self) -> List[str]:
-        return [f"{l}-{n}" for l in ["B", "A", "IC", "IB", "IA", "S"] for n in range(1, 11)]
-    
-    def gt_league_races(self) -> List[str]:
-        sets = {
-            "French Nationals": 2,
-            "German Nationals": 3,
-            "Italian Nationals": 2,
-            "Japan Nationals": 3,
-            "UK Nationals": 3,
-            "US Nationals": 3,
-            "Euro League": 3,
-            "Pacific League": 3
-        }
-        return [f"{series} Race {n + 1}" for series, count in sets.items() for n in range(0, count)]
-    
-    def gt_league_series(self) -> List[str]:
-        return ["World League"]
-    
-    def special_events_races(self) -> List[str]:
-        sets = {
-            "Sunday Cup": 3,
-            "Clubman Cup": 3,
-            "FF Challenge": 3,
-            "FR Challenge": 3,
-            "Mid-engine Challenge": 3,
-            "4WD Challenge": 3,
-            "Lightweight \"K\" Cup": 3,
-            "Compact Car World Cup": 3,
-            "Luxury Sedan Cup": 3,
-            "Muscle Car Cup": 3,
-            "Convertible Car World Cup": 3,
-            "Historic Car Cup": 3,
-            "Station Wagon Cup": 3,
-            "80's Sports Car Cup": 5,
-            "Grand Touring Car Trophy": 3,
-            "Pure Sports Car Cup": 3,
-            "Tuned NA Car No.1 Cup": 3,
-            "Tuned Turbo Car No.1 Cup": 3,
-            "Gran Turismo All-Stars": 5,
-            "Super Touring Trophy": 5
-        }
-        return [f"{series} Race {n + 1}" for series, count in sets.items() for n in range(0, count)]
-    
-    def special_events_series(self) -> List[str]:
-        return ["GT300 Championship", "GT500 Championship"]
-    
-    def dirt_events_races(self) -> List[str]:
-        courses = [
-            "Smokey Mountain South",
-            "Smokey Mountain North",
-            "Green Forest Roadway",
-            "Tahiti Maze",
-            "Tahiti Dirt Route 3",
-            "Smokey Mountain North Reverse",
-            "Tahiti Dirt Route 3 Reverse"
-        ]
-        return [f"{course} Race {n + 1}" for course in courses for n in range(0, 3)]
-    
-    def dirt_events_hard_races(self) -> List[str]:
-        courses = [
-            "Pikes Peak Downhill",
-            "Pikes Peak Hill Climb"
-        ]
-        return [f"{course} Race {n + 1}" for course in courses for n in range(0, 3)]
-    
-    def maker_events_races(self) -> List[str]:
-        return [
-            "106 Challenge", "155 & 156 Race", "500 Meeting", "Altezza Cup", "Alto Works Cup",
-            "Cappuccino Cup", "Celica Meeting", "Challenge S2000", "Civic Race", "Clio Cup",
-            "Corvette Meeting", "Cuore Challenge", "DB-7 Trophy", "Delta Cup", "Demio Race",
-            "Elan Trophy", "Elise Trophy", "Golf Cup", "GT-R Meeting",  "Ka Challenge",
-            "March Trophy", "MGF Challenge", "Mini Challenge", "Mirage Cup", "MX-5 Trophy",
-            "Neon Trophy", "New Beetle Challenge", "Saxo Challenge", "Silvia & 180SX Club",
-            "Sirion Challenge", "SLK Trophy", "SVX Challenge", "Tigra Cup", "TT Challenge",
-            "Tuscan Speed Challenge", "Viper Festival of Speed", "Yaris Trophy", "ZZ Challenge"
-        ]
-    
-    def maker_events_styles(self) -> List[str]:
-        return ["Normal", "Racing"]
-    
-    def maker_events_normal_only(self) -> List[str]:
-        return [
-            "3 Series Cup", "AZ-1 Challenge", "Beat the Beat", "Evolution Meeting", "Focus Challenge",
-            "Impreza Challenge", "Midget Contest", "MR-S Trophy", "NSX Trophy", "Pulsar Cup",
-            "RX-7 Meeting", "Skyline R34 Challenge", "Starlet Meeting", "Type R Meeting"
-        ]
-    
-    def event_synth_ranks(self) -> List[str]:
-        return ["Easy/Beginner", "Normal/Intermediate"]
-    
-    def event_synth_hard_ranks(self) -> List[str]:
-        return ["Hard/Advanced"]
-    
-    def event_synth_long_ranks(self) -> List[str]:
-        return ["Expert/Pro"]
-    
-    def endurances(self) -> List[str]:
-        return [
-            "Grand Valley 300km",
-            "Apricot Hill 200km",
-            "Seattle 100 Miles",
-            "Laguna Seca 200 Miles",
-            "Millennium Rome 2 Hours",
-            "Trial Mountain 30 Laps",
-            "Special Stage Route 5 All-Night"
-        ]
+    def career_sections(self) -> FrozenSet[str]:
+        return self.options_plan.career_sections
+    
+    arcade_classes = _catalog("arcade_classes", _names, "C|B|A|S")
+    arcade_ranks = _catalog("arcade_ranks", _names, "Easy|Normal")
+    arcade_hard_ranks = _catalog("arcade_hard_ranks", _names, "Difficult")
+    arcade_tarmac_tracks = _catalog("arcade_tarmac_tracks", _names, (
+        "Tahiti Road|Midfield Raceway|High Speed Ring|Super Speedway|Seattle Short Course|Rome Short Course|"
+        "Red Rock Valley Speedway|Seattle Circuit|Rome Circuit|Grindelwald|Laguna Seca Raceway|Apricot Hill Speedway|"
+        "Trial Mountain Circuit|Clubman Stage Route 5|Grand Valley East Section|Grand Valley Speedway|"
+        "Special Stage Route 5|Autumn Ring|Test Course|Deep Forest Raceway|Rome Night"
+    ))
+    licence_tests = _catalog("licence_tests", _names, (
+        "B-1|B-2|B-3|B-4|B-5|B-6|B-7|B-8|B-9|B-10|A-1|A-2|A-3|A-4|A-5|A-6|A-7|A-8|A-9|A-10|IC-1|IC-2|IC-3|IC-4|IC-5|"
+        "IC-6|IC-7|IC-8|IC-9|IC-10|IB-1|IB-2|IB-3|IB-4|IB-5|IB-6|IB-7|IB-8|IB-9|IB-10|IA-1|IA-2|IA-3|IA-4|IA-5|IA-6|"
+        "IA-7|IA-8|IA-9|IA-10|S-1|S-2|S-3|S-4|S-5|S-6|S-7|S-8|S-9|S-10"
+    ))
+    gt_league_races = _catalog("gt_league_races", SeriesRaces, name, "Gran Turismo League", (
+        "French Nationals=2|German Nationals=3|Italian Nationals=2|Japan Nationals=3|UK Nationals=3|US Nationals=3|"
+        "Euro League=3|Pacific League=3"
+    ))
+    gt_league_series = _catalog("gt_league_series", _names, "World League")
+    special_events_races = _catalog("special_events_races", SeriesRaces, name, "Special Events", (
+        "Sunday Cup=3|Clubman Cup=3|FF Challenge=3|FR Challenge=3|Mid-engine Challenge=3|4WD Challenge=3|"
+        "Lightweight \"K\" Cup=3|Compact Car World Cup=3|Luxury Sedan Cup=3|Muscle Car Cup=3|"
+        "Convertible Car World Cup=3|Historic Car Cup=3|Station Wagon Cup=3|80's Sports Car Cup=5|"
+        "Grand Touring Car Trophy=3|Pure Sports Car Cup=3|Tuned NA Car No.1 Cup=3|Tuned Turbo Car No.1 Cup=3|"
+        "Gran Turismo All-Stars=5|Super Touring Trophy=5"
+    ))
+    special_events_series = _catalog("special_events_series", _names, "GT300 Championship|GT500 Championship")
+    dirt_events_races = _catalog("dirt_events_races", SeriesRaces, name, "Dirt Events", (
+        "Smokey Mountain South=3|Smokey Mountain North=3|Green Forest Roadway=3|Tahiti Maze=3|Tahiti Dirt Route 3=3|"
+        "Smokey Mountain North Reverse=3|Tahiti Dirt Route 3 Reverse=3"
+    ))
+    dirt_events_hard_races = _catalog("dirt_events_hard_races", SeriesRaces, name, "Dirt Events", (
+        "Pikes Peak Downhill=3|Pikes Peak Hill Climb=3"
+    ))
+    maker_events_races = _catalog("maker_events_races", _names, (
+        "106 Challenge|155 & 156 Race|500 Meeting|Altezza Cup|Alto Works Cup|Cappuccino Cup|Celica Meeting|"
+        "Challenge S2000|Civic Race|Clio Cup|Corvette Meeting|Cuore Challenge|DB-7 Trophy|Delta Cup|Demio Race|"
+        "Elan Trophy|Elise Trophy|Golf Cup|GT-R Meeting|Ka Challenge|March Trophy|MGF Challenge|Mini Challenge|"
+        "Mirage Cup|MX-5 Trophy|Neon Trophy|New Beetle Challenge|Saxo Challenge|Silvia & 180SX Club|Sirion Challenge|"
+        "SLK Trophy|SVX Challenge|Tigra Cup|TT Challenge|Tuscan Speed Challenge|Viper Festival of Speed|Yaris Trophy|"
+        "ZZ Challenge"
+    ))
+    maker_events_styles = _catalog("maker_events_styles", _names, "Normal|Racing")
+    maker_events_normal_only = _catalog("maker_events_normal_only", _names, (
+        "3 Series Cup|AZ-1 Challenge|Beat the Beat|Evolution Meeting|Focus Challenge|Impreza Challenge|Midget Contest|"
+        "MR-S Trophy|NSX Trophy|Pulsar Cup|RX-7 Meeting|Skyline R34 Challenge|Starlet Meeting|Type R Meeting"
+    ))
+    event_synth_ranks = _catalog("event_synth_ranks", _names, "Easy/Beginner|Normal/Intermediate")
+    event_synth_hard_ranks = _catalog("event_synth_hard_ranks", _names, "Hard/Advanced")
+    event_synth_long_ranks = _catalog("event_synth_long_ranks", _names, "Expert/Pro")
+    endurances = _catalog("endurances", _names, (
+        "Grand Valley 300km|Apricot Hill 200km|Seattle 100 Miles|Laguna Seca 200 Miles|Millennium Rome 2 Hours|"
+        "Trial Mountain 30 Laps|Special Stage Route 5 All-Night"
+    ))
     
     def optional_game_constraint_templates(self) -> List[GameObjectiveTemplate]:
         return []
     
     def game_objective_templates(self) -> List[GameObjectiveTemplate]:
-        return self.get_arcade_objectives() + self.get_career_objectives()
-    
-    def get_arcade_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium at TRACK in Class CLASS at RANK level or higher in Arcade Mode!",
-                data = {
-                    "CLASS": (self.arcade_classes, 1),
-                    "RANK": (self.arcade_ranks, 1),
-                    "TRACK": (self.arcade_tarmac_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the race at TRACK in Class CLASS at RANK level or higher in Arcade Mode!",
-                data = {
-                    "CLASS": (self.arcade_classes, 1),
-                    "RANK": (self.arcade_ranks, 1),
-                    "TRACK": (self.arcade_tarmac_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Stand on the podium at TRACK in Class CLASS at RANK level in Arcade Mode!",
-                data = {
-                    "CLASS": (self.arcade_classes, 1),
-                    "RANK": (self.arcade_hard_ranks, 1),
-                    "TRACK": (self.arcade_tarmac_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the race at TRACK in Class CLASS at RANK level in Arcade Mode!",
-                data = {
-                    "CLASS": (self.arcade_classes, 1),
-                    "RANK": (self.arcade_hard_ranks, 1),
-                    "TRACK": (self.arcade_tarmac_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            )
-        ] if self.include_arcade_mode else []
-    
-    def get_career_objectives(self) -> List[GameObjectiveTemplate]:
-        return (self.get_licence_objectives() +
-                self.get_league_objectives() +
-                self.get_event_objectives() +
-                self.get_rally_objectives() +
-                self.get_maker_objectives() +
-                self.get_event_synth_objectives() +
-                self.get_endurance_objectives()
-                if self.include_career_mode else [])
-    
-    def get_licence_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Beat the target time in licence test LICENCE!",
-                data = {
-                    "LICENCE": (self.licence_tests, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Get the Gold Medal in licence test LICENCE!",
-                data = {
-                    "LICENCE": (self.licence_tests, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            )
-        ] if self.include_licence_tests else []
-    
-    def get_league_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium in the RACE!",
-                data = {
-                    "RACE": (self.gt_league_races, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the RACE!",
-                data = {
-                    "RACE": (self.gt_league_races, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Become the LEAGUE Champion!",
-                data = {
-                    "LEAGUE": (self.gt_league_series, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_gt_league else []
-    
-    def get_event_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium in the RACE!",
-                data = {
-                    "RACE": (self.special_events_races, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the RACE!",
-                data = {
-                    "RACE": (self.special_events_races, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Become the LEAGUE Champion!",
-                data = {
-                    "LEAGUE": (self.special_events_series, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_special_events else []
-    
-    def get_rally_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Win the RALLY!",
-                data = {
-                    "RALLY": (self.dirt_events_races, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the RALLY!",
-                data = {
-                    "RALLY": (self.dirt_events_hard_races, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            )
-        ] if self.include_rally_events else []
-    
-    def get_maker_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Win the RACE in a STYLE car!",
-                data = {
-                    "RACE": (self.maker_events_races, 1),
-                    "STYLE": (self.maker_events_styles, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the RACE in a Normal car!",
-                data = {
-                    "RACE": (self.maker_events_normal_only, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_maker_events else []
-    
-    def get_event_synth_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium in an Event Generator Race at RANK difficulty or higher!",
-                data = {
-                    "RANK": (self.arcade_hard_ranks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win an Event Generator Race at RANK difficulty or higher!",
-                data = {
-                    "RANK": (self.event_synth_ranks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Stand on the podium in an Event Generator Race at RANK difficulty!",
-                data = {
-                    "RANK": (self.event_synth_hard_ranks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win an Event Generator Race at RANK difficulty!",
-                data = {
-                    "RANK": (self.event_synth_hard_ranks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Become the Champion in an Event Generator Championship as RANK difficulty!",
-                data = {
-                    "RANK": (self.event_synth_long_ranks, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = True,
-                weight = 3
-            )
-        ] if self.include_event_synth else []
-    
-    def get_endurance_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Win the RACE!",
-                data = {
-                    "RACE": (self.endurances, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_endurances else []
\ No newline at end of file
+        return list(self.template_set.templates)
+    
+    def filter_game_objective_templates(
+        self,
+        include_difficult: bool = False,
+        include_time_consuming: bool = False
+    ) -> List[GameObjectiveTemplate]:
+        return list(self.template_set.filter(include_difficult, include_time_consuming))
+    
+    @cached_property
+    def template_set(self) -> TemplateSet:
+        return _template_set(self.options_plan.flags)
+    # End of generated members
+
+# Generated rows from tools/games.json by python -m tools.generate; edit the specification, not this block
+# Each row, split by ";": the section enabling it, its label, the PLACEHOLDER=catalog it fills,
+# is_time_consuming and is_difficult as 1 or 0, its weight and its conflict key, if any
+_objective_rows: Tuple[str, ...] = (
+    "Arcade Mode;Stand on the podium at TRACK in Class CLASS at RANK level or higher in Arcade Mode!;"
+    "CLASS=arcade_classes|RANK=arcade_ranks|TRACK=arcade_tarmac_tracks;0;0;3;arcade_race",
+    "Arcade Mode;Win the race at TRACK in Class CLASS at RANK level or higher in Arcade Mode!;"
+    "CLASS=arcade_classes|RANK=arcade_ranks|TRACK=arcade_tarmac_tracks;0;0;3;arcade_race",
+    "Arcade Mode;Stand on the podium at TRACK in Class CLASS at RANK level in Arcade Mode!;"
+    "CLASS=arcade_classes|RANK=arcade_hard_ranks|TRACK=arcade_tarmac_tracks;0;1;3;arcade_hard_race",
+    "Arcade Mode;Win the race at TRACK in Class CLASS at RANK level in Arcade Mode!;"
+    "CLASS=arcade_classes|RANK=arcade_hard_ranks|TRACK=arcade_tarmac_tracks;0;1;3;arcade_hard_race",
+    "Licenses;Beat the target time in licence test LICENCE!;LICENCE=licence_tests;0;0;3;licence_test",
+    "Licenses;Get the Gold Medal in licence test LICENCE!;LICENCE=licence_tests;0;1;3;licence_test",
+    "Gran Turismo League;Stand on the podium in the RACE!;RACE=gt_league_races;0;0;3;gt_league_race",
+    "Gran Turismo League;Win the RACE!;RACE=gt_league_races;0;0;3;gt_league_race",
+    "Gran Turismo League;Become the LEAGUE Champion!;LEAGUE=gt_league_series;1;0;3;",
+    "Special Events;Stand on the podium in the RACE!;RACE=special_events_races;0;0;3;special_event_race",
+    "Special Events;Win the RACE!;RACE=special_events_races;0;0;3;special_event_race",
+    "Special Events;Become the LEAGUE Champion!;LEAGUE=special_events_series;1;0;3;",
+    "Dirt Events;Win the RALLY!;RALLY=dirt_events_races;0;0;3;",
+    "Dirt Events;Win the RALLY!;RALLY=dirt_events_hard_races;0;1;3;",
+    "Manufacturer Events;Win the RACE in a STYLE car!;RACE=maker_events_races|STYLE=maker_events_styles;0;0;3;",
+    "Manufacturer Events;Win the RACE in a Normal car!;RACE=maker_events_normal_only;0;0;3;",
+    "Event Generator;Stand on the podium in an Event Generator Race at RANK difficulty or higher!;"
+    "RANK=arcade_hard_ranks;0;0;3;",
+    "Event Generator;Win an Event Generator Race at RANK difficulty or higher!;RANK=event_synth_ranks;0;0;3;",
+    "Event Generator;Stand on the podium in an Event Generator Race at RANK difficulty!;RANK=event_synth_hard_ranks;0;"
+    "1;3;event_generator_hard_race",
+    "Event Generator;Win an Event Generator Race at RANK difficulty!;RANK=event_synth_hard_ranks;0;1;3;"
+    "event_generator_hard_race",
+    "Event Generator;Become the Champion in an Event Generator Championship as RANK difficulty!;"
+    "RANK=event_synth_long_ranks;1;1;3;",
+    "Endurance;Win the RACE!;RACE=endurances;1;0;3;"
+)
+# End of generated rows
\ No newline at end of file
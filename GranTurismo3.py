@@ -1,8 +1,17 @@
 #v3
 
+# Generated engine from tools/engine.py.in by python -m tools.generate; edit tools/engine.py.in, not this block
 from __future__ import annotations
 
-from typing import List, Set
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Tuple
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from functools import cache, cached_property
+from itertools import accumulate
+from operator import itemgetter
+from sys import intern
+from weakref import WeakValueDictionary
 
 from dataclasses import dataclass
 
@@ -13,8 +22,128 @@ from ..game_objective_template import GameObjectiveTemplate
 
 from ..enums import KeymastersKeepGamePlatforms
 
-@dataclass
+# Every catalog the game class declares, by name, for the objective rows to look up
+_catalogs: Dict[str, Callable] = {}
+
+def _catalog(name: str, builder: Callable, *arguments: Any) -> staticmethod:
+    # The catalog the game class declares as name: built from the arguments on first use, then the same frozen
+    # sequence for every caller
+    built = []
+    
+    def catalog() -> Sequence[Any]:
+        if not built:
+            built.append(builder(*arguments))
+        return built[0]
+    
+    catalog.__name__ = catalog.__qualname__ = name
+    _catalogs[name] = catalog
+    return staticmethod(catalog)
+
+def _names(names: str) -> Tuple[str, ...]:
+    # Interned, so every game module loaded in the process shares one copy of each name
+    return tuple(map(intern, names.split("|")))
+
+def _pairs(entries: str) -> Iterator[List[str]]:
+    # Each "key=value" entry of a "|"-separated string
+    return (entry.split("=") for entry in entries.split("|"))
+
+class Race(tuple):
+    """
+    One race of a series as (game, section, series, number), only formatted as a label when it is shown. Named fields
+    like a NamedTuple, without the class creation a NamedTuple costs at import
+    """
+    __slots__ = ()
+    
+    game = property(itemgetter(0))
+    section = property(itemgetter(1))
+    series = property(itemgetter(2))
+    number = property(itemgetter(3))
+    
+    def __str__(self) -> str:
+        return f"{self.series} Race {self.number}"
+
+class SeriesRaces(Sequence):
+    """
+    Every race of a group of series, numbered within each series and only built when a race is looked up
+    """
+    __slots__ = ("game", "section", "series", "starts")
+    
+    def __init__(self, game: str, section: str, race_counts: str) -> None:
+        series, counts = zip(*_pairs(race_counts))
+        self.game = game
+        self.section = section
+        self.series = tuple(map(intern, series))
+        # Where each series starts, then the number of races in all of them
+        self.starts = (0, *accumulate(map(int, counts)))
+    
+    def __len__(self) -> int:
+        return self.starts[-1]
+    
+    def __getitem__(self, index: int) -> Race:
+        if index < 0:
+            index += self.starts[-1]
+        if not 0 <= index < self.starts[-1]:
+            raise IndexError("race index out of range")
+        position = bisect_right(self.starts, index) - 1
+        return Race((self.game, self.section, self.series[position], index - self.starts[position] + 1))
+
+def _key_bits(keys: Sequence[str], chosen: FrozenSet[str]) -> int:
+    # One bit per key of an option set, in order, for the keys chosen
+    return sum(1 << bit for bit, key in enumerate(keys) if key in chosen)
+
+@cache
+def _row_template(index: int) -> GameObjectiveTemplate:
+    # The flyweight every options fingerprint enabling the row's section shares
+    _, label, data, is_time_consuming, is_difficult, weight, _ = _objective_rows[index].split(";")
+    return GameObjectiveTemplate(
+        label = intern(label),
+        data = {placeholder: (_catalogs[catalog], 1) for placeholder, catalog in _pairs(data)},
+        is_time_consuming = is_time_consuming == "1",
+        is_difficult = is_difficult == "1",
+        weight = int(weight)
+    )
+
+class TemplateSet:
+    """
+    The objective templates one options fingerprint enables, in row order, shared by every game instance with those
+    options. Each selection by difficulty is kept once it is asked for
+    """
+    def __init__(self, flags: int, rows: Tuple[int, ...]) -> None:
+        self.flags = flags
+        self.rows = rows
+        self.templates = tuple(map(_row_template, rows))
+        self.selections = {}
+    
+    def filter(self, include_difficult: bool, include_time_consuming: bool) -> Tuple[GameObjectiveTemplate, ...]:
+        key = include_difficult, include_time_consuming
+        templates = self.selections.get(key)
+        if templates is None:
+            templates = self.selections[key] = tuple(
+                template for template in self.templates
+                if (include_difficult or not template.is_difficult)
+                and (include_time_consuming or not template.is_time_consuming)
+            )
+        return templates
+
+# Held weakly, so each options fingerprint's templates live only while a game instance uses them
+_template_sets: WeakValueDictionary[int, TemplateSet] = WeakValueDictionary()
+
+def _template_set(flags: int) -> TemplateSet:
+    template_set = _template_sets.get(flags)
+    if template_set is None:
+        # A row's section is the text before its first ";"
+        template_set = _template_sets[flags] = TemplateSet(flags, tuple(
+            index for index, row in enumerate(_objective_rows) if flags >> _sections.index(row.partition(";")[0]) & 1
+        ))
+    return template_set
+# End of generated engine
+
+# Generated options from tools/games.json by python -m tools.generate; edit the specification, not this block
+@dataclass(init = False, repr = False, eq = False)
 class GT3APOptions:
+    """
+    The options GT3 adds to Keymaster's Keep
+    """
     gran_turismo_3_include_arcade_mode: GT3IncludeArcadeMode
     gran_turismo_3_include_career_mode: GT3IncludeCareerMode
     gran_turismo_3_career_sections: GT3CareerSections
@@ -42,9 +171,43 @@ class GT3CareerSections(OptionSet):
     - Rally Events
     """
     display_name = "Gran Turismo Mode Objective Areas"
-    valid_keys = ["Licenses", "Beginner League", "Amateur League", "Professional League", "Endurance League", "Rally Events"]
+    valid_keys = [
+        "Licenses", "Beginner League", "Amateur League", "Professional League", "Endurance League", "Rally Events"
+    ]
     default = valid_keys
 
+class GT3OptionsPlan(tuple):
+    """
+    The player's options for this game, resolved once so objective generation never walks the options again.
+    Immutable, so the flags worked out as it is made always match the options
+    """
+    __slots__ = ()
+    
+    def __new__(cls, options: GT3APOptions) -> GT3OptionsPlan:
+        include_arcade_mode = bool(options.gran_turismo_3_include_arcade_mode.value)
+        include_career_mode = bool(options.gran_turismo_3_include_career_mode.value)
+        career_sections = frozenset(options.gran_turismo_3_career_sections.value)
+        # One bit per entry in _sections, in the same order. Settings switched off by a mode toggle are left
+        # out, so equivalent plans share a key
+        flags = (
+            include_arcade_mode |
+            include_career_mode << 1 |
+            (_key_bits(GT3CareerSections.valid_keys, career_sections) << 2 if include_career_mode else 0)
+        )
+        return tuple.__new__(cls, (include_arcade_mode, include_career_mode, career_sections, flags))
+    
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Copies and pickles are made from the fields, as the options are not kept
+        return tuple.__new__, (type(self), tuple(self))
+    
+    include_arcade_mode = property(itemgetter(0))
+    include_career_mode = property(itemgetter(1))
+    career_sections = property(itemgetter(2))
+    flags = property(itemgetter(3))
+
+_sections: Tuple[str, ...] = ("Arcade Mode", "Gran Turismo Mode", *GT3CareerSections.valid_keys)
+# End of generated options
+
 class GranTurismo3(Game):
     """
     Gran Turismo 3: A-Spec was the second-best selling game on PS2 for good
@@ -63,408 +226,130 @@ class GranTurismo3(Game):
     is_adult_only_or_unrated = False
     options_cls = GT3APOptions
     
+    # Generated members from tools/games.json by python -m tools.generate; edit the specification, not this block
+    @cached_property
+    def options_plan(self) -> GT3OptionsPlan:
+        return GT3OptionsPlan(self.archipelago_options)
+    
     @property
     def include_arcade_mode(self) -> bool:
-        return bool(self.archipelago_options.gran_turismo_3_include_arcade_mode.value)
+        return self.options_plan.include_arcade_mode
     
     @property
     def include_career_mode(self) -> bool:
-        return bool(self.archipelago_options.gran_turismo_3_include_career_mode.value)
-    
-    @property
-    def career_sections(self) -> Set[str]:
-        return self.archipelago_options.gran_turismo_3_career_sections.value
-    
-    @property
-    def include_licence_tests(self) -> bool:
-        return "Licenses" in self.career_sections
-    
-    @property
-    def include_beginner_league(self) -> bool:
-        return "Beginner League" in self.career_sections
-    
-    @property
-    def include_amateur_league(self) -> bool:
-        return "Amateur League" in self.career_sections
-    
-    @property
-    def include_professional_league(self) -> bool:
-        return "Professional League" in self.career_sections
-    
-    @property
-    def include_endurance_league(self) -> bool:
-        return "Endurance League" in self.career_sections
+        return self.options_plan.include_career_mode
     
     @property
-    def include_rally_events(self) -> bool:
-        return "Rally Events" in self.career_sections
-    
-    def arcade_tarmac_classes(self) -> List[str]:
-        return ["C", "B", "A", "S"]
-    
-    def arcade_ranks(self) -> List[str]:
-        return ["Easy", "Normal"]
-    
-    def arcade_hard_ranks(self) -> List[str]:
-        return ["Hard", "Pro"]
-    
-    def arcade_tarmac_tracks(self) -> List[str]:
-        return [
-            "Apricot Hill Raceway", "Cote d'Azur", "Deep Forest Raceway",
-            "Grand Valley Speedway", "Mazda Raceway Laguna Seca",
-            "Mid-Field Raceway", "Rome Circuit", "Seattle Circuit",
-            "Special Stage Route 5", "Special Stage Route 5 Wet",
-            "Special Stage Route 11", "Super Speedway", "Test Course",
-            "Tokyo R246", "Trial Mountain Circuit"
-        ]
-    
-    def arcade_rally_tracks(self) -> List[str]:
-        return ["Smokey Mountain", "Swiss Alps", "Tahiti Circuit", "Tahiti Maze"]
-    
-    def licence_tests(self) -> List[str]:
-        return [f"{l}-{n}" for l in ["B", "A", "IB", "IA", "S", "R"] for n in range(1, 9)]
-    
-    def beginner_league_races(self) -> List[str]:
-        sets = {
-            "Sunday Cup": 3,
-            "Clubman Cup": 3,
-            "FF Challenge": 3,
-            "FR Challenge": 3,
-            "MR Challenge": 3,
-            "4WD Challenge": 3,
-            "Lightweight Sports Car Cup": 3,
-            "Stars & Stripes": 4,
-            "Spider & Roadster": 3,
-            "80's Sports Car Cup": 3,
-            "Race of NA Sports": 3,
-            "Race of Turbo Sports": 3,
-            "Tourist Trophy": 5,
-            "Legend of Silver Arrow": 3,
-            "Altezza Race": 5,
-            "Vitz/Yaris Race": 5,
-            "Type-R Meeting": 5,
-            "Evolution Meeting": 3,
-            "Beetle Cup": 5,
-            "Gran Turismo World Championship": 10
-        }
-        return [f"{series} Race {n + 1}" for series, count in sets.items() for n in range(0, count)]
-    
-    def beginner_league_series(self) -> List[str]:
-        return [
-            "Tourist Trophy", "Altezza Race",
-            "Vitz/Yaris Race", "Type-R Meeting",
-            "Beetle Cup", "Gran Turismo World Championship"
-        ]
-    
-    def amateur_league_races(self) -> List[str]:
-        sets = {
-            "Japanese Championship": 5,
-            "American Championship": 5,
-            "European Championship": 5,
-            "Gran Turismo World Championship": 10,
-            "German Touring Car Championship": 5,
-            "FF Challenge": 3,
-            "FR Challenge": 3,
-            "MR Challenge": 3,
-            "4WD Challenge": 3,
-            "Stars & Stripes": 4,
-            "Boxer Spirit": 3,
-            "80's Sports Car Cup": 3,
-            "Race of NA Sports": 3,
-            "Race of Turbo Sports": 3,
-            "Gran Turismo All Stars": 10,
-            "All Japan GT Championship": 10,
-            "Tourist Trophy": 5,
-            "Race of Red Emblem": 3,
-            "Legend of Silver Arrow": 3,
-            "Altezza Race": 5,
-            "Type-R Meeting": 5,
-            "Evolution Meeting": 3,
-            "Dream Car Championship": 7
-        }
-        return [f"{series} Race {n + 1}" for series, count in sets.items() for n in range(0, count)]
-    
-    def amateur_league_series(self) -> List[str]:
-        return [
-            "Japanese Championship", "American Championship", "European Championship",
-            "Gran Turismo World Championship", "German Touring Car Championship",
-            "Gran Turismo All Stars", "All Japan GT Championship", "Tourist Trophy",
-            "Altezza Race", "Type-R Meeting", "Dream Car Championship"
-        ]
-    
-    def professional_league_races(self) -> List[str]:
-        sets = {
-            "British GT Car Cup": 3,
-            "GT World Championship": 10,
-            "FF Challenge": 3,
-            "FR Challenge": 3,
-            "4WD Challenge": 3,
-            "MR Challenge": 3,
-            "Spider & Roadster": 3,
-            "Boxer Spirit": 3,
-            "Race of NA Sports": 3,
-            "Race of Turbo Sports": 3,
-            "Gran Turismo All Stars": 10,
-            "All Japan GT Championship": 10,
-            "Italian Avant Garde": 2,
-            "Race of Red Emblem": 3,
-            "Vitz/Yaris Race": 5,
-            "Elise Trophy": 5,
-            "Clio Trophy": 5,
-            "Tuscan Challenge": 5,
-            "Dream Car Championship": 7,
-            "Polyphony Digital Cup": 10,
-            "Like the Wind": 1,
-            "Formula GT": 10
-        }
-        return [f"{series} Race {n + 1}" for series, count in sets.items() for n in range(0, count)]
-    
-    def professional_league_series(self) -> List[str]:
-        return [
-            "GT World Championship", "Gran Turismo All Stars",
-            "All Japan GT Championship", "Vitz/Yaris Race", "Clio Trophy",
-            "Tuscan Challenge", "Dream Car Championship",
-            "Polyphony Digital Cup", "Formula GT"
-        ]
-    
-    def endurances(self) -> List[str]:
-        return [
-            "Grand Valley 300km", "Seattle 100 Miles",
-            "Laguna Seca 200 Miles", "Passage to Colosseo",
-            "Trial Mountain 2 Hours", "Special Stage Route 11 All-Night",
-            "Roadster Endurance", "Tokyo R246 Endurance",
-            "Mistral 78 Laps", "Super Speedway 150 Miles"
-        ]
-    
-    def rally_events(self) -> List[str]:
-        return [
-            "Tahiti Challenge", "Tahiti Challenge II",
-            "Tahiti Maze", "Tahiti Maze II",
-            "Smokey Mountain Rally", "Smokey Mountain Rally II",
-            "Alpine Rally", "Alpine Rally II",
-            "Super Special Route 5", "Super Special Route 5 II",
-        ]
+    def career_sections(self) -> FrozenSet[str]:
+        return self.options_plan.career_sections
+    
+    arcade_tarmac_classes = _catalog("arcade_tarmac_classes", _names, "C|B|A|S")
+    arcade_ranks = _catalog("arcade_ranks", _names, "Easy|Normal")
+    arcade_hard_ranks = _catalog("arcade_hard_ranks", _names, "Hard|Pro")
+    arcade_tarmac_tracks = _catalog("arcade_tarmac_tracks", _names, (
+        "Apricot Hill Raceway|Cote d'Azur|Deep Forest Raceway|Grand Valley Speedway|Mazda Raceway Laguna Seca|"
+        "Mid-Field Raceway|Rome Circuit|Seattle Circuit|Special Stage Route 5|Special Stage Route 5 Wet|"
+        "Special Stage Route 11|Super Speedway|Test Course|Tokyo R246|Trial Mountain Circuit"
+    ))
+    arcade_rally_tracks = _catalog("arcade_rally_tracks", _names, (
+        "Smokey Mountain|Swiss Alps|Tahiti Circuit|Tahiti Maze"
+    ))
+    licence_tests = _catalog("licence_tests", _names, (
+        "B-1|B-2|B-3|B-4|B-5|B-6|B-7|B-8|A-1|A-2|A-3|A-4|A-5|A-6|A-7|A-8|IB-1|IB-2|IB-3|IB-4|IB-5|IB-6|IB-7|IB-8|IA-1|"
+        "IA-2|IA-3|IA-4|IA-5|IA-6|IA-7|IA-8|S-1|S-2|S-3|S-4|S-5|S-6|S-7|S-8|R-1|R-2|R-3|R-4|R-5|R-6|R-7|R-8"
+    ))
+    beginner_league_races = _catalog("beginner_league_races", SeriesRaces, name, "Beginner League", (
+        "Sunday Cup=3|Clubman Cup=3|FF Challenge=3|FR Challenge=3|MR Challenge=3|4WD Challenge=3|"
+        "Lightweight Sports Car Cup=3|Stars & Stripes=4|Spider & Roadster=3|80's Sports Car Cup=3|Race of NA Sports=3|"
+        "Race of Turbo Sports=3|Tourist Trophy=5|Legend of Silver Arrow=3|Altezza Race=5|Vitz/Yaris Race=5|"
+        "Type-R Meeting=5|Evolution Meeting=3|Beetle Cup=5|Gran Turismo World Championship=10"
+    ))
+    beginner_league_series = _catalog("beginner_league_series", _names, (
+        "Tourist Trophy|Altezza Race|Vitz/Yaris Race|Type-R Meeting|Beetle Cup|Gran Turismo World Championship"
+    ))
+    amateur_league_races = _catalog("amateur_league_races", SeriesRaces, name, "Amateur League", (
+        "Japanese Championship=5|American Championship=5|European Championship=5|Gran Turismo World Championship=10|"
+        "German Touring Car Championship=5|FF Challenge=3|FR Challenge=3|MR Challenge=3|4WD Challenge=3|"
+        "Stars & Stripes=4|Boxer Spirit=3|80's Sports Car Cup=3|Race of NA Sports=3|Race of Turbo Sports=3|"
+        "Gran Turismo All Stars=10|All Japan GT Championship=10|Tourist Trophy=5|Race of Red Emblem=3|"
+        "Legend of Silver Arrow=3|Altezza Race=5|Type-R Meeting=5|Evolution Meeting=3|Dream Car Championship=7"
+    ))
+    amateur_league_series = _catalog("amateur_league_series", _names, (
+        "Japanese Championship|American Championship|European Championship|Gran Turismo World Championship|"
+        "German Touring Car Championship|Gran Turismo All Stars|All Japan GT Championship|Tourist Trophy|Altezza Race|"
+        "Type-R Meeting|Dream Car Championship"
+    ))
+    professional_league_races = _catalog("professional_league_races", SeriesRaces, name, "Professional League", (
+        "British GT Car Cup=3|GT World Championship=10|FF Challenge=3|FR Challenge=3|4WD Challenge=3|MR Challenge=3|"
+        "Spider & Roadster=3|Boxer Spirit=3|Race of NA Sports=3|Race of Turbo Sports=3|Gran Turismo All Stars=10|"
+        "All Japan GT Championship=10|Italian Avant Garde=2|Race of Red Emblem=3|Vitz/Yaris Race=5|Elise Trophy=5|"
+        "Clio Trophy=5|Tuscan Challenge=5|Dream Car Championship=7|Polyphony Digital Cup=10|Like the Wind=1|"
+        "Formula GT=10"
+    ))
+    professional_league_series = _catalog("professional_league_series", _names, (
+        "GT World Championship|Gran Turismo All Stars|All Japan GT Championship|Vitz/Yaris Race|Clio Trophy|"
+        "Tuscan Challenge|Dream Car Championship|Polyphony Digital Cup|Formula GT"
+    ))
+    endurances = _catalog("endurances", _names, (
+        "Grand Valley 300km|Seattle 100 Miles|Laguna Seca 200 Miles|Passage to Colosseo|Trial Mountain 2 Hours|"
+        "Special Stage Route 11 All-Night|Roadster Endurance|Tokyo R246 Endurance|Mistral 78 Laps|"
+        "Super Speedway 150 Miles"
+    ))
+    rally_events = _catalog("rally_events", _names, (
+        "Tahiti Challenge|Tahiti Challenge II|Tahiti Maze|Tahiti Maze II|Smokey Mountain Rally|"
+        "Smokey Mountain Rally II|Alpine Rally|Alpine Rally II|Super Special Route 5|Super Special Route 5 II"
+    ))
     
     def optional_game_constraint_templates(self) -> List[GameObjectiveTemplate]:
         return []
     
     def game_objective_templates(self) -> List[GameObjectiveTemplate]:
-        return self.get_arcade_objectives() + self.get_career_objectives()
-    
-    def get_arcade_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium at TRACK in Class CLASS at RANK level or higher in Arcade Mode!",
-                data = {
-                    "CLASS": (self.arcade_tarmac_classes, 1),
-                    "RANK": (self.arcade_ranks, 1),
-                    "TRACK": (self.arcade_tarmac_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the race at TRACK in Class CLASS at RANK level or higher in Arcade Mode!",
-                data = {
-                    "CLASS": (self.arcade_tarmac_classes, 1),
-                    "RANK": (self.arcade_ranks, 1),
-                    "TRACK": (self.arcade_tarmac_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Stand on the podium at TRACK in Class CLASS at RANK level in Arcade Mode!",
-                data = {
-                    "CLASS": (self.arcade_tarmac_classes, 1),
-                    "RANK": (self.arcade_hard_ranks, 1),
-                    "TRACK": (self.arcade_tarmac_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the race at TRACK in Class CLASS at RANK level in Arcade Mode!",
-                data = {
-                    "CLASS": (self.arcade_tarmac_classes, 1),
-                    "RANK": (self.arcade_hard_ranks, 1),
-                    "TRACK": (self.arcade_tarmac_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the race at TRACK in Class R at RANK level or higher in Arcade Mode!",
-                data = {
-                    "RANK": (self.arcade_ranks, 1),
-                    "TRACK": (self.arcade_rally_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the race at TRACK in Class R at RANK level in Arcade Mode!",
-                data = {
-                    "RANK": (self.arcade_hard_ranks, 1),
-                    "TRACK": (self.arcade_rally_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            )
-        ] if self.include_arcade_mode else []
-    
-    def get_career_objectives(self) -> List[GameObjectiveTemplate]:
-        return (self.get_licence_objectives() +
-                self.get_beginner_objectives() +
-                self.get_amateur_objectives() +
-                self.get_professional_objectives() +
-                self.get_endurance_objectives() +
-                self.get_rally_objectives()
-                if self.include_career_mode else [])
-    
-    def get_licence_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Beat the target time in licence test LICENCE!",
-                data = {
-                    "LICENCE": (self.licence_tests, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Get the Gold Medal in licence test LICENCE!",
-                data = {
-                    "LICENCE": (self.licence_tests, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            )
-        ] if self.include_licence_tests else []
-    
-    def get_beginner_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium in the Beginner League RACE!",
-                data = {
-                    "RACE": (self.beginner_league_races, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),           
-            GameObjectiveTemplate(
-                label = "Win the Beginner League RACE!",
-                data = {
-                    "RACE": (self.beginner_league_races, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Become the Beginner League LEAGUE Champion!",
-                data = {
-                    "LEAGUE": (self.beginner_league_series, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_beginner_league else []
-    
-    def get_amateur_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium in the Amateur League RACE!",
-                data = {
-                    "RACE": (self.amateur_league_races, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),           
-            GameObjectiveTemplate(
-                label = "Win the Amateur League RACE!",
-                data = {
-                    "RACE": (self.amateur_league_races, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Become the Amateur League LEAGUE Champion!",
-                data = {
-                    "LEAGUE": (self.amateur_league_series, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_amateur_league else []
-    
-    def get_professional_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium in the Professional League RACE!",
-                data = {
-                    "RACE": (self.professional_league_races, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            ),           
-            GameObjectiveTemplate(
-                label = "Win the Professional League RACE!",
-                data = {
-                    "RACE": (self.professional_league_races, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Become the Professional League LEAGUE Champion!",
-                data = {
-                    "LEAGUE": (self.professional_league_series, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = True,
-                weight = 3
-            )
-        ] if self.include_professional_league else []
-    
-    def get_endurance_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Win the RACE!",
-                data = {
-                    "RACE": (self.endurances, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_endurance_league else []
-    
-    def get_rally_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Beat your rival at RALLY!",
-                data = {
-                    "RALLY": (self.rally_events, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_rally_events else []
\ No newline at end of file
+        return list(self.template_set.templates)
+    
+    def filter_game_objective_templates(
+        self,
+        include_difficult: bool = False,
+        include_time_consuming: bool = False
+    ) -> List[GameObjectiveTemplate]:
+        return list(self.template_set.filter(include_difficult, include_time_consuming))
+    
+    @cached_property
+    def template_set(self) -> TemplateSet:
+        return _template_set(self.options_plan.flags)
+    # End of generated members
+
+# Generated rows from tools/games.json by python -m tools.generate; edit the specification, not this block
+# Each row, split by ";": the section enabling it, its label, the PLACEHOLDER=catalog it fills,
+# is_time_consuming and is_difficult as 1 or 0, its weight and its conflict key, if any
+_objective_rows: Tuple[str, ...] = (
+    "Arcade Mode;Stand on the podium at TRACK in Class CLASS at RANK level or higher in Arcade Mode!;"
+    "CLASS=arcade_tarmac_classes|RANK=arcade_ranks|TRACK=arcade_tarmac_tracks;0;0;3;arcade_race",
+    "Arcade Mode;Win the race at TRACK in Class CLASS at RANK level or higher in Arcade Mode!;"
+    "CLASS=arcade_tarmac_classes|RANK=arcade_ranks|TRACK=arcade_tarmac_tracks;0;0;3;arcade_race",
+    "Arcade Mode;Stand on the podium at TRACK in Class CLASS at RANK level in Arcade Mode!;"
+    "CLASS=arcade_tarmac_classes|RANK=arcade_hard_ranks|TRACK=arcade_tarmac_tracks;0;1;3;arcade_hard_race",
+    "Arcade Mode;Win the race at TRACK in Class CLASS at RANK level in Arcade Mode!;"
+    "CLASS=arcade_tarmac_classes|RANK=arcade_hard_ranks|TRACK=arcade_tarmac_tracks;0;1;3;arcade_hard_race",
+    "Arcade Mode;Win the race at TRACK in Class R at RANK level or higher in Arcade Mode!;"
+    "RANK=arcade_ranks|TRACK=arcade_rally_tracks;0;0;3;",
+    "Arcade Mode;Win the race at TRACK in Class R at RANK level in Arcade Mode!;"
+    "RANK=arcade_hard_ranks|TRACK=arcade_rally_tracks;0;1;3;",
+    "Licenses;Beat the target time in licence test LICENCE!;LICENCE=licence_tests;0;0;3;licence_test",
+    "Licenses;Get the Gold Medal in licence test LICENCE!;LICENCE=licence_tests;0;1;3;licence_test",
+    "Beginner League;Stand on the podium in the Beginner League RACE!;RACE=beginner_league_races;0;0;3;"
+    "beginner_league_race",
+    "Beginner League;Win the Beginner League RACE!;RACE=beginner_league_races;0;0;3;beginner_league_race",
+    "Beginner League;Become the Beginner League LEAGUE Champion!;LEAGUE=beginner_league_series;1;0;3;",
+    "Amateur League;Stand on the podium in the Amateur League RACE!;RACE=amateur_league_races;0;0;3;"
+    "amateur_league_race",
+    "Amateur League;Win the Amateur League RACE!;RACE=amateur_league_races;0;0;3;amateur_league_race",
+    "Amateur League;Become the Amateur League LEAGUE Champion!;LEAGUE=amateur_league_series;1;0;3;",
+    "Professional League;Stand on the podium in the Professional League RACE!;RACE=professional_league_races;0;1;3;"
+    "professional_league_race",
+    "Professional League;Win the Professional League RACE!;RACE=professional_league_races;0;1;3;"
+    "professional_league_race",
+    "Professional League;Become the Professional League LEAGUE Champion!;LEAGUE=professional_league_series;1;1;3;",
+    "Endurance League;Win the RACE!;RACE=endurances;1;0;3;",
+    "Rally Events;Beat your rival at RALLY!;RALLY=rally_events;0;0;3;"
+)
+# End of generated rows
\ No newline at end of file
@@ -1,8 +1,17 @@
 #v3
 
+# Generated engine from tools/engine.py.in by python -m tools.generate; edit tools/engine.py.in, not this block
 from __future__ import annotations
 
-from typing import List, Set
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Tuple
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from functools import cache, cached_property
+from itertools import accumulate
+from operator import itemgetter
+from sys import intern
+from weakref import WeakValueDictionary
 
 from dataclasses import dataclass
 
@@ -13,8 +22,128 @@ from ..game_objective_template import GameObjectiveTemplate
 
 from ..enums import KeymastersKeepGamePlatforms
 
-@dataclass
+# Every catalog the game class declares, by name, for the objective rows to look up
+_catalogs: Dict[str, Callable] = {}
+
+def _catalog(name: str, builder: Callable, *arguments: Any) -> staticmethod:
+    # The catalog the game class declares as name: built from the arguments on first use, then the same frozen
+    # sequence for every caller
+    built = []
+    
+    def catalog() -> Sequence[Any]:
+        if not built:
+            built.append(builder(*arguments))
+        return built[0]
+    
+    catalog.__name__ = catalog.__qualname__ = name
+    _catalogs[name] = catalog
+    return staticmethod(catalog)
+
+def _names(names: str) -> Tuple[str, ...]:
+    # Interned, so every game module loaded in the process shares one copy of each name
+    return tuple(map(intern, names.split("|")))
+
+def _pairs(entries: str) -> Iterator[List[str]]:
+    # Each "key=value" entry of a "|"-separated string
+    return (entry.split("=") for entry in entries.split("|"))
+
+class Race(tuple):
+    """
+    One race of a series as (game, section, series, number), only formatted as a label when it is shown. Named fields
+    like a NamedTuple, without the class creation a NamedTuple costs at import
+    """
+    __slots__ = ()
+    
+    game = property(itemgetter(0))
+    section = property(itemgetter(1))
+    series = property(itemgetter(2))
+    number = property(itemgetter(3))
+    
+    def __str__(self) -> str:
+        return f"{self.series} Race {self.number}"
+
+class SeriesRaces(Sequence):
+    """
+    Every race of a group of series, numbered within each series and only built when a race is looked up
+    """
+    __slots__ = ("game", "section", "series", "starts")
+    
+    def __init__(self, game: str, section: str, race_counts: str) -> None:
+        series, counts = zip(*_pairs(race_counts))
+        self.game = game
+        self.section = section
+        self.series = tuple(map(intern, series))
+        # Where each series starts, then the number of races in all of them
+        self.starts = (0, *accumulate(map(int, counts)))
+    
+    def __len__(self) -> int:
+        return self.starts[-1]
+    
+    def __getitem__(self, index: int) -> Race:
+        if index < 0:
+            index += self.starts[-1]
+        if not 0 <= index < self.starts[-1]:
+            raise IndexError("race index out of range")
+        position = bisect_right(self.starts, index) - 1
+        return Race((self.game, self.section, self.series[position], index - self.starts[position] + 1))
+
+def _key_bits(keys: Sequence[str], chosen: FrozenSet[str]) -> int:
+    # One bit per key of an option set, in order, for the keys chosen
+    return sum(1 << bit for bit, key in enumerate(keys) if key in chosen)
+
+@cache
+def _row_template(index: int) -> GameObjectiveTemplate:
+    # The flyweight every options fingerprint enabling the row's section shares
+    _, label, data, is_time_consuming, is_difficult, weight, _ = _objective_rows[index].split(";")
+    return GameObjectiveTemplate(
+        label = intern(label),
+        data = {placeholder: (_catalogs[catalog], 1) for placeholder, catalog in _pairs(data)},
+        is_time_consuming = is_time_consuming == "1",
+        is_difficult = is_difficult == "1",
+        weight = int(weight)
+    )
+
+class TemplateSet:
+    """
+    The objective templates one options fingerprint enables, in row order, shared by every game instance with those
+    options. Each selection by difficulty is kept once it is asked for
+    """
+    def __init__(self, flags: int, rows: Tuple[int, ...]) -> None:
+        self.flags = flags
+        self.rows = rows
+        self.templates = tuple(map(_row_template, rows))
+        self.selections = {}
+    
+    def filter(self, include_difficult: bool, include_time_consuming: bool) -> Tuple[GameObjectiveTemplate, ...]:
+        key = include_difficult, include_time_consuming
+        templates = self.selections.get(key)
+        if templates is None:
+            templates = self.selections[key] = tuple(
+                template for template in self.templates
+                if (include_difficult or not template.is_difficult)
+                and (include_time_consuming or not template.is_time_consuming)
+            )
+        return templates
+
+# Held weakly, so each options fingerprint's templates live only while a game instance uses them
+_template_sets: WeakValueDictionary[int, TemplateSet] = WeakValueDictionary()
+
+def _template_set(flags: int) -> TemplateSet:
+    template_set = _template_sets.get(flags)
+    if template_set is None:
+        # A row's section is the text before its first ";"
+        template_set = _template_sets[flags] = TemplateSet(flags, tuple(
+            index for index, row in enumerate(_objective_rows) if flags >> _sections.index(row.partition(";")[0]) & 1
+        ))
+    return template_set
+# End of generated engine
+
+# Generated options from tools/games.json by python -m tools.generate; edit the specification, not this block
+@dataclass(init = False, repr = False, eq = False)
 class GT4APOptions:
+    """
+    The options GT4 adds to Keymaster's Keep
+    """
     gran_turismo_4_include_arcade_mode: GT4IncludeArcadeMode
     gran_turismo_4_include_career_mode: GT4IncludeCareerMode
     gran_turismo_4_arcade_track_types: GT4ArcadeTrackTypes
@@ -77,6 +206,52 @@ class GT4DrivingMissionTypes(OptionSet):
     valid_keys = ["The Pass", "3 Lap Battle", "Slipstream Battle", "1 Lap Magic"]
     default = valid_keys
 
+class GT4OptionsPlan(tuple):
+    """
+    The player's options for this game, resolved once so objective generation never walks the options again.
+    Immutable, so the flags worked out as it is made always match the options
+    """
+    __slots__ = ()
+    
+    def __new__(cls, options: GT4APOptions) -> GT4OptionsPlan:
+        include_arcade_mode = bool(options.gran_turismo_4_include_arcade_mode.value)
+        include_career_mode = bool(options.gran_turismo_4_include_career_mode.value)
+        arcade_track_types = frozenset(options.gran_turismo_4_arcade_track_types.value)
+        career_sections = frozenset(options.gran_turismo_4_career_sections.value)
+        driving_mission_types = frozenset(options.gran_turismo_4_driving_mission_types.value)
+        # One bit per entry in _sections, in the same order. Settings switched off by a mode toggle are left
+        # out, so equivalent plans share a key
+        flags = (
+            include_arcade_mode |
+            include_career_mode << 1 |
+            (_key_bits(GT4ArcadeTrackTypes.valid_keys, arcade_track_types) << 2 if include_arcade_mode else 0) |
+            (_key_bits(GT4CareerSections.valid_keys, career_sections) << 6 if include_career_mode else 0) |
+            (
+                _key_bits(GT4DrivingMissionTypes.valid_keys, driving_mission_types) << 15
+                if include_career_mode and "Driving Missions" in career_sections else 0
+            )
+        )
+        return tuple.__new__(cls, (
+            include_arcade_mode, include_career_mode, arcade_track_types, career_sections, driving_mission_types, flags
+        ))
+    
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Copies and pickles are made from the fields, as the options are not kept
+        return tuple.__new__, (type(self), tuple(self))
+    
+    include_arcade_mode = property(itemgetter(0))
+    include_career_mode = property(itemgetter(1))
+    arcade_track_types = property(itemgetter(2))
+    career_sections = property(itemgetter(3))
+    driving_mission_types = property(itemgetter(4))
+    flags = property(itemgetter(5))
+
+_sections: Tuple[str, ...] = (
+    "Arcade Mode", "Gran Turismo Mode", *GT4ArcadeTrackTypes.valid_keys, *GT4CareerSections.valid_keys,
+    *GT4DrivingMissionTypes.valid_keys
+)
+# End of generated options
+
 class GranTurismo4(Game):
     """
     Widely considered to be the peak of the franchise, Gran Turismo 4 is
@@ -95,726 +270,173 @@ class GranTurismo4(Game):
     is_adult_only_or_unrated = False
     options_cls = GT4APOptions
     
+    # Generated members from tools/games.json by python -m tools.generate; edit the specification, not this block
+    @cached_property
+    def options_plan(self) -> GT4OptionsPlan:
+        return GT4OptionsPlan(self.archipelago_options)
+    
     @property
     def include_arcade_mode(self) -> bool:
-        return bool(self.archipelago_options.gran_turismo_4_include_arcade_mode.value)
+        return self.options_plan.include_arcade_mode
     
     @property
     def include_career_mode(self) -> bool:
-        return bool(self.archipelago_options.gran_turismo_4_include_career_mode.value)
-    
-    @property
-    def arcade_track_types(self) -> Set[str]:
-        return self.archipelago_options.gran_turismo_4_arcade_track_types.value
-    
-    @property
-    def career_sections(self) -> Set[str]:
-        return self.archipelago_options.gran_turismo_4_career_sections.value
-    
-    @property
-    def driving_mission_types(self) -> Set[str]:
-        return self.archipelago_options.gran_turismo_4_driving_mission_types.value
-    
-    @property
-    def include_world_tracks(self) -> bool:
-        return "World Circuits" in self.arcade_track_types
-    
-    @property
-    def include_original_tracks(self) -> bool:
-        return "Original Circuits" in self.arcade_track_types
-    
-    @property
-    def include_city_tracks(self) -> bool:
-        return "City Courses" in self.arcade_track_types
-    
-    @property
-    def include_rally_tracks(self) -> bool:
-        return "Dirt & Snow" in self.arcade_track_types
-    
-    @property
-    def include_licence_tests(self) -> bool:
-        return "Licenses" in self.career_sections
-    
-    @property
-    def include_beginner_events(self) -> bool:
-        return "Beginner Events" in self.career_sections
-    
-    @property
-    def include_professional_events(self) -> bool:
-        return "Professional Events" in self.career_sections
-    
-    @property
-    def include_extreme_events(self) -> bool:
-        return "Extreme Events" in self.career_sections
-    
-    @property
-    def include_endurance_events(self) -> bool:
-        return "Endurance Events" in self.career_sections
-    
-    @property
-    def include_special_conditions(self) -> bool:
-        return "Special Conditions" in self.career_sections
-    
-    @property
-    def include_regional_events(self) -> bool:
-        return "Regional Events" in self.career_sections
-    
-    @property
-    def include_manufacturer_events(self) -> bool:
-        return "Manufacturer Events" in self.career_sections
-    
-    @property
-    def include_driving_missions(self) -> bool:
-        return "Driving Missions" in self.career_sections
+        return self.options_plan.include_career_mode
     
     @property
-    def include_the_pass_missions(self) -> bool:
-        return "The Pass" in self.driving_mission_types
+    def arcade_track_types(self) -> FrozenSet[str]:
+        return self.options_plan.arcade_track_types
     
     @property
-    def include_3_lap_battle_missions(self) -> bool:
-        return "3 Lap Battle" in self.driving_mission_types
+    def career_sections(self) -> FrozenSet[str]:
+        return self.options_plan.career_sections
     
     @property
-    def include_slipstream_battle_missions(self) -> bool:
-        return "Slipstream Battle" in self.driving_mission_types
-    
-    @property
-    def include_1_lap_magic_missions(self) -> bool:
-        return "1 Lap Magic" in self.driving_mission_types
-    
-    def arcade_world_tracks(self) -> List[str]:
-        return [
-            "Tsukuba Circuit (Dry)", "Tsukuba Circuit (Wet)",
-            "Mazda Raceway Laguna Seca", "Nürburgring Nordschleife",
-            "Infineon Raceway Sports Car Course", "Infineon Raceway Stock Car Course",
-            "Twin Ring Motegi East Short Course", "Twin Ring Motegi West Short Course",
-            "Twin Ring Motegi Road Course", "Twin Ring Motegi Super Speedway",
-            "Suzuka Circuit East", "Suzuka Circuit West", "Suzuka Circuit",
-            "Fuji Speedway '80s", "Fuji Speedway '90s",
-            "Fuji Speedway 2005 GT", "Fuji Speedway 2005",
-            "Circuit de la Sarthe I", "Circuit de la Sarthe II"
-        ]
-    
-    def arcade_original_tracks(self) -> List[str]:
-        return [
-            "El Capitan", "High Speed Ring", "Trial Mountain Circuit", "Grand Valley East", "Grand Valley Speedway",
-            "Autumn Ring", "Autumn Ring Mini", "Deep Forest Raceway", "Apricot Hill Raceway",
-            "Mid-Field Raceway", "Beginner Course", "Motorland", "Test Course"
-        ]
-    
-    def arcade_city_tracks(self) -> List[str]:
-        return [
-            "Clubman Stage Route 5", "Special Stage Route 5", "New York", "Seattle Circuit",
-            "Tokyo R246", "Opera Paris", "Hong Kong", "Seoul Central", "Côte d'Azur"
-        ]
-    
-    def arcade_city_duels(self) -> List[str]:
-        return ["George V Paris", "Costa di Amalfi", "Citta di Aria"]
-    
-    def arcade_rally_tracks(self) -> List[str]:
-        return [
-            "Ice Arena", "Chamonix", "Grand Canyon", "Swiss Alps",
-            "Tahiti Maze", "Cathedral Rocks Trail I", "Cathedral Rocks Trail II"
-        ]
-    
-    def licence_tests(self) -> List[str]:
-        return [f"{l}-{n}" for l in ["B", "A", "IB", "IA", "S"] for n in range(1, 17)]
-    
-    def beginner_events(self) -> List[str]:
-        sets = {
-            "Sunday Cup": 5,
-            "FF Challenge": 5,
-            "FR Challenge": 5,
-            "4WD Challenge": 5,
-            "MR Challenge": 5,
-            "Light-weight K-Car Cup": 3,
-            "Spider & Roadster": 3,
-            "Sport Truck Race": 3
-        }
-        return [f"{series} Race {n + 1}" for series, count in sets.items() for n in range(0, count)]
-    
-    def professional_events(self) -> List[str]:
-        sets = {
-            "Clubman Cup": 5,
-            "Tuning Car Grand Prix": 5,
-            "Race of NA Sport": 5,
-            "Race of Turbo Sport": 5,
-            "Boxer Spirit": 3,
-            "World Classics": 5,
-            "Supercar Festival": 5,
-            "Gran Turismo World Championship": 10
-        }
-        return [f"{series} Race {n + 1}" for series, count in sets.items() for n in range(0, count)]
-    
-    def professional_series(self) -> List[str]:
-        return ["Tuning Car Grand Prix", "World Classics", "Gran Turismo World Championship"]
-    
-    def extreme_events(self) -> List[str]:
-        sets = {
-            "Gran Turismo All Stars": 10,
-            "Dream Car Championship": 10,
-            "Polyphony Digital Cup": 10,
-            "Like the Wind": 1,
-            "Formula GT World Championship": 15,
-            "World Circuit Tour": 8,
-            "Premium Sports Lounge": 5
-        }
-        return [f"{series} Race {n + 1}" for series, count in sets.items() for n in range(0, count)]
-    
-    def extreme_series(self) -> List[str]:
-        return ["Gran Turismo All Stars", "Dream Car Championship", "Polyphony Digital Cup", "Formula GT World Championship"]
-    
-    def endurance_events(self) -> List[str]:
-        return [
-            "Grand Valley 300km", "Laguna Seca 200 miles", "Roadster 4h",
-            "Tokyo R246 300km", "Super Speedway 150 miles",
-            "Nurburgring 24h", "Nurburgring 4h",
-            "Suzuka 1000km", "Motegi 8h", "Tsukuba 9h",
-            "Circuit de la Sarthe 24 h I", "Circuit de la Sarthe 24 h II",
-            "Fuji 1000km", "Infineon World Sports",
-            "El Capitan 200 miles", "New York 200 miles"
-        ]
-    
-    def special_conditions(self) -> List[str]:
-        sets = {
-            "Capri Rally": 2,
-            "Chamonix Rally": 2,
-            "George V Rally": 2,
-            "Grand Canyon Rally": 2,
-            "Swiss Alps Rally": 2,
-            "Tour of Tahiti": 2,
-            "Tsukuba Wet Race": 1,
-            "Umbria Rally": 2,
-            "Whistler Ice Race": 2,
-            "Yosemite Rally I": 2,
-            "Yosemite Rally II": 2
-        }
-        return [f"{series} Race {n + 1}" for series, count in sets.items() for n in range(0, count)]
-    
-    def special_conditions_levels(self) -> List[str]:
-        return ["Easy", "Normal", "Hard"]
-    
-    def regional_events(self) -> List[str]:
-        sets = {
-            "Muscle Car Championship": 3,
-            "Old Muscle Car Championship": 3,
-            "Stars & Stripes": 3,
-            "United States Championship": 5,
-            "British GT Car Cup": 5,
-            "British Lightweights": 3,
-            "Pan Euro Championship": 5,
-            "European Classic Car Championship": 5,
-            "European Hot Hatch Car Championship": 5,
-            "French Championship": 5,
-            "German Touring Car Championship": 5,
-            "Italian Festival": 3,
-            "Schwarzwald League A": 3,
-            "Schwarzwald League B": 5,
-            "All Japan GT Championship": 10,
-            "Japan Championship": 5,
-            "Japanese 70's Classics": 5,
-            "Japanese 80's Festival": 5,
-            "Japanese 90's Challenge": 5,
-            "Japanese Compact Cup": 5
-        }
-        return [f"{series} Race {n + 1}" for series, count in sets.items() for n in range(0, count)]
-    
-    def regional_events_long(self) -> List[str]:
-        sets = {
-            "1000 Miles!": 4
-        }
-        return [f"{series} Race {n + 1}" for series, count in sets.items() for n in range(0, count)]
-    
-    def regional_series(self) -> List[str]:
-        return [
-            "United States Championship",
-            "1000 Miles!",
-            "British GT Car Cup",
-            "Pan Euro Championship",
-            "European Classic Car Championship",
-            "European Hot Hatch Car Championship",
-            "French Championship",
-            "German Touring Car Championship",
-            "All Japan GT Championship",
-            "Japan Championship",
-            "Japanese Compact Cup"
-        ]
-    
-    def manufacturer_events(self) -> List[str]:
-        sets = {
-            "1 Series Trophy": 3,
-            "206 Cup": 5,
-            "2HP-2CV Classics": 5,
-            "A3 Cup": 3,
-            "Alpine Cup": 5,
-            "Altezza Race": 5,
-            "Aston Martin Festival": 3,
-            "Beetle Cup": 5,
-            "Blackpool Racers": 5,
-            "Camaro Meeting": 3,
-            "Civic Race": 5,
-            "Clio Trophy": 5,
-            "Club \"M\"": 5,
-            "Club \"RE\"": 5,
-            "Club \"Z\"": 5,
-            "Copen Race": 3,
-            "Corvette Festival": 5,
-            "Crossfire Trophy": 3,
-            "Elise Trophy": 5,
-            "Evolution Meeting": 3,
-            "GTA Cup": 3,
-            "GTI Cup": 5,
-            "Hyundai Sports Festival": 5,
-            "Isuzu Sports Classics": 3,
-            "Legends of the Silver Arrow": 3,
-            "Lotus Classics": 5,
-            "Lupo Cup": 5,
-            "March/Micra Brothers": 3,
-            "Megane Cup": 5,
-            "MG Festival": 5,
-            "Midget II Race": 1,
-            "Mini Sports Meeting": 5,
-            "Mirage Cup": 5,
-            "Race of Red Emblem": 5,
-            "Race of the Pleiades": 5,
-            "Roadster Cup": 5,
-            "RX-8 Cup": 5,
-            "Saleen S7 Club": 5,
-            "Shelby Cobra Cup": 5,
-            "Silvia Sisters": 3,
-            "SL Challenge": 3,
-            "Speedster Trophy": 5,
-            "Spitfire Cup": 5,
-            "Subaru 360 Race": 1,
-            "Suzuki Concepts": 3,
-            "Suzuki K Cup": 3,
-            "Tourist Trophy": 3,
-            "Type R Meeting": 5,
-            "Vitz/Yaris Race": 5
-        }
-        return [f"{series} Race {n + 1}" for series, count in sets.items() for n in range(0, count)]
-    
-    def manufacturer_series(self) -> List[str]:
-        return [
-            "2HP-2CV Classics",
-            "Alpine Cup",
-            "Beetle Cup",
-            "Clio Trophy",
-            "Club \"M\"",
-            "Elise Trophy",
-            "Lotus Classics",
-            "Lupo Cup",
-            "Megane Cup",
-            "Mirage Cup",
-            "Race of the Pleiades",
-            "Roadster Cup",
-            "RX-8 Cup",
-            "Tourist Trophy"
-        ]
-    
-    def the_pass_missions(self) -> List[int]:
-        return list(range(1, 11))
-    
-    def three_lap_battle_missions(self) -> List[int]:
-        return list(range(11, 21))
-    
-    def slipstream_battle_missions(self) -> List[int]:
-        return list(range(21, 25))
-    
-    def one_lap_magic_missions(self) -> List[int]:
-        return list(range(25, 35))
+    def driving_mission_types(self) -> FrozenSet[str]:
+        return self.options_plan.driving_mission_types
+    
+    arcade_world_tracks = _catalog("arcade_world_tracks", _names, (
+        "Tsukuba Circuit (Dry)|Tsukuba Circuit (Wet)|Mazda Raceway Laguna Seca|Nürburgring Nordschleife|"
+        "Infineon Raceway Sports Car Course|Infineon Raceway Stock Car Course|Twin Ring Motegi East Short Course|"
+        "Twin Ring Motegi West Short Course|Twin Ring Motegi Road Course|Twin Ring Motegi Super Speedway|"
+        "Suzuka Circuit East|Suzuka Circuit West|Suzuka Circuit|Fuji Speedway '80s|Fuji Speedway '90s|"
+        "Fuji Speedway 2005 GT|Fuji Speedway 2005|Circuit de la Sarthe I|Circuit de la Sarthe II"
+    ))
+    arcade_original_tracks = _catalog("arcade_original_tracks", _names, (
+        "El Capitan|High Speed Ring|Trial Mountain Circuit|Grand Valley East|Grand Valley Speedway|Autumn Ring|"
+        "Autumn Ring Mini|Deep Forest Raceway|Apricot Hill Raceway|Mid-Field Raceway|Beginner Course|Motorland|"
+        "Test Course"
+    ))
+    arcade_city_tracks = _catalog("arcade_city_tracks", _names, (
+        "Clubman Stage Route 5|Special Stage Route 5|New York|Seattle Circuit|Tokyo R246|Opera Paris|Hong Kong|"
+        "Seoul Central|Côte d'Azur"
+    ))
+    arcade_city_duels = _catalog("arcade_city_duels", _names, "George V Paris|Costa di Amalfi|Citta di Aria")
+    arcade_rally_tracks = _catalog("arcade_rally_tracks", _names, (
+        "Ice Arena|Chamonix|Grand Canyon|Swiss Alps|Tahiti Maze|Cathedral Rocks Trail I|Cathedral Rocks Trail II"
+    ))
+    licence_tests = _catalog("licence_tests", _names, (
+        "B-1|B-2|B-3|B-4|B-5|B-6|B-7|B-8|B-9|B-10|B-11|B-12|B-13|B-14|B-15|B-16|A-1|A-2|A-3|A-4|A-5|A-6|A-7|A-8|A-9|"
+        "A-10|A-11|A-12|A-13|A-14|A-15|A-16|IB-1|IB-2|IB-3|IB-4|IB-5|IB-6|IB-7|IB-8|IB-9|IB-10|IB-11|IB-12|IB-13|IB-14|"
+        "IB-15|IB-16|IA-1|IA-2|IA-3|IA-4|IA-5|IA-6|IA-7|IA-8|IA-9|IA-10|IA-11|IA-12|IA-13|IA-14|IA-15|IA-16|S-1|S-2|"
+        "S-3|S-4|S-5|S-6|S-7|S-8|S-9|S-10|S-11|S-12|S-13|S-14|S-15|S-16"
+    ))
+    beginner_events = _catalog("beginner_events", SeriesRaces, name, "Beginner Events", (
+        "Sunday Cup=5|FF Challenge=5|FR Challenge=5|4WD Challenge=5|MR Challenge=5|Light-weight K-Car Cup=3|"
+        "Spider & Roadster=3|Sport Truck Race=3"
+    ))
+    professional_events = _catalog("professional_events", SeriesRaces, name, "Professional Events", (
+        "Clubman Cup=5|Tuning Car Grand Prix=5|Race of NA Sport=5|Race of Turbo Sport=5|Boxer Spirit=3|"
+        "World Classics=5|Supercar Festival=5|Gran Turismo World Championship=10"
+    ))
+    professional_series = _catalog("professional_series", _names, (
+        "Tuning Car Grand Prix|World Classics|Gran Turismo World Championship"
+    ))
+    extreme_events = _catalog("extreme_events", SeriesRaces, name, "Extreme Events", (
+        "Gran Turismo All Stars=10|Dream Car Championship=10|Polyphony Digital Cup=10|Like the Wind=1|"
+        "Formula GT World Championship=15|World Circuit Tour=8|Premium Sports Lounge=5"
+    ))
+    extreme_series = _catalog("extreme_series", _names, (
+        "Gran Turismo All Stars|Dream Car Championship|Polyphony Digital Cup|Formula GT World Championship"
+    ))
+    endurance_events = _catalog("endurance_events", _names, (
+        "Grand Valley 300km|Laguna Seca 200 miles|Roadster 4h|Tokyo R246 300km|Super Speedway 150 miles|"
+        "Nurburgring 24h|Nurburgring 4h|Suzuka 1000km|Motegi 8h|Tsukuba 9h|Circuit de la Sarthe 24 h I|"
+        "Circuit de la Sarthe 24 h II|Fuji 1000km|Infineon World Sports|El Capitan 200 miles|New York 200 miles"
+    ))
+    special_conditions = _catalog("special_conditions", SeriesRaces, name, "Special Conditions", (
+        "Capri Rally=2|Chamonix Rally=2|George V Rally=2|Grand Canyon Rally=2|Swiss Alps Rally=2|Tour of Tahiti=2|"
+        "Tsukuba Wet Race=1|Umbria Rally=2|Whistler Ice Race=2|Yosemite Rally I=2|Yosemite Rally II=2"
+    ))
+    special_conditions_levels = _catalog("special_conditions_levels", _names, "Easy|Normal|Hard")
+    regional_events = _catalog("regional_events", SeriesRaces, name, "Regional Events", (
+        "Muscle Car Championship=3|Old Muscle Car Championship=3|Stars & Stripes=3|United States Championship=5|"
+        "British GT Car Cup=5|British Lightweights=3|Pan Euro Championship=5|European Classic Car Championship=5|"
+        "European Hot Hatch Car Championship=5|French Championship=5|German Touring Car Championship=5|"
+        "Italian Festival=3|Schwarzwald League A=3|Schwarzwald League B=5|All Japan GT Championship=10|"
+        "Japan Championship=5|Japanese 70's Classics=5|Japanese 80's Festival=5|Japanese 90's Challenge=5|"
+        "Japanese Compact Cup=5"
+    ))
+    regional_events_long = _catalog("regional_events_long", SeriesRaces, name, "Regional Events", "1000 Miles!=4")
+    regional_series = _catalog("regional_series", _names, (
+        "United States Championship|1000 Miles!|British GT Car Cup|Pan Euro Championship|"
+        "European Classic Car Championship|European Hot Hatch Car Championship|French Championship|"
+        "German Touring Car Championship|All Japan GT Championship|Japan Championship|Japanese Compact Cup"
+    ))
+    manufacturer_events = _catalog("manufacturer_events", SeriesRaces, name, "Manufacturer Events", (
+        "1 Series Trophy=3|206 Cup=5|2HP-2CV Classics=5|A3 Cup=3|Alpine Cup=5|Altezza Race=5|Aston Martin Festival=3|"
+        "Beetle Cup=5|Blackpool Racers=5|Camaro Meeting=3|Civic Race=5|Clio Trophy=5|Club \"M\"=5|Club \"RE\"=5|"
+        "Club \"Z\"=5|Copen Race=3|Corvette Festival=5|Crossfire Trophy=3|Elise Trophy=5|Evolution Meeting=3|GTA Cup=3|"
+        "GTI Cup=5|Hyundai Sports Festival=5|Isuzu Sports Classics=3|Legends of the Silver Arrow=3|Lotus Classics=5|"
+        "Lupo Cup=5|March/Micra Brothers=3|Megane Cup=5|MG Festival=5|Midget II Race=1|Mini Sports Meeting=5|"
+        "Mirage Cup=5|Race of Red Emblem=5|Race of the Pleiades=5|Roadster Cup=5|RX-8 Cup=5|Saleen S7 Club=5|"
+        "Shelby Cobra Cup=5|Silvia Sisters=3|SL Challenge=3|Speedster Trophy=5|Spitfire Cup=5|Subaru 360 Race=1|"
+        "Suzuki Concepts=3|Suzuki K Cup=3|Tourist Trophy=3|Type R Meeting=5|Vitz/Yaris Race=5"
+    ))
+    manufacturer_series = _catalog("manufacturer_series", _names, (
+        "2HP-2CV Classics|Alpine Cup|Beetle Cup|Clio Trophy|Club \"M\"|Elise Trophy|Lotus Classics|Lupo Cup|Megane Cup|"
+        "Mirage Cup|Race of the Pleiades|Roadster Cup|RX-8 Cup|Tourist Trophy"
+    ))
+    the_pass_missions = _catalog("the_pass_missions", range, 1, 11)
+    three_lap_battle_missions = _catalog("three_lap_battle_missions", range, 11, 21)
+    slipstream_battle_missions = _catalog("slipstream_battle_missions", range, 21, 25)
+    one_lap_magic_missions = _catalog("one_lap_magic_missions", range, 25, 35)
     
     def optional_game_constraint_templates(self) -> List[GameObjectiveTemplate]:
         return []
     
     def game_objective_templates(self) -> List[GameObjectiveTemplate]:
-        return self.get_arcade_objectives() + self.get_career_objectives()
-    
-    def get_arcade_objectives(self) -> List[GameObjectiveTemplate]:
-        return (self.get_world_tracks_objectives() +
-                self.get_original_tracks_objectives() +
-                self.get_city_tracks_objectives() +
-                self.get_rally_tracks_objectives()
-                if self.include_arcade_mode else [])
-    
-    def get_world_tracks_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium at TRACK in Arcade Mode!",
-                data = {
-                    "TRACK": (self.arcade_world_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the race at TRACK in Arcade Mode!",
-                data = {
-                    "TRACK": (self.arcade_world_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_world_tracks else []
-    
-    def get_original_tracks_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium at TRACK in Arcade Mode!",
-                data = {
-                    "TRACK": (self.arcade_original_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the race at TRACK in Arcade Mode!",
-                data = {
-                    "TRACK": (self.arcade_original_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_original_tracks else []
-    
-    def get_city_tracks_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium at TRACK in Arcade Mode!",
-                data = {
-                    "TRACK": (self.arcade_city_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the race at TRACK in Arcade Mode!",
-                data = {
-                    "TRACK": (self.arcade_city_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the race at TRACK in Arcade Mode!",
-                data = {
-                    "TRACK": (self.arcade_city_duels, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            )
-        ] if self.include_city_tracks else []
-    
-    def get_rally_tracks_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Win the race at TRACK in Arcade Mode!",
-                data = {
-                    "TRACK": (self.arcade_rally_tracks, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_rally_tracks else []
-    
-    def get_career_objectives(self) -> List[GameObjectiveTemplate]:
-        return (self.get_licence_objectives() +
-                self.get_beginner_events_objectives() +
-                self.get_professional_events_objectives() +
-                self.get_extreme_events_objectives() +
-                self.get_endurance_events_objectives() +
-                self.get_special_conditions_objectives() +
-                self.get_regional_events_objectives() +
-                self.get_manufacturer_events_objectives() +
-                self.get_driving_missions_objectives()
-                if self.include_career_mode else [])
-    
-    def get_licence_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Beat the target time in licence test LICENCE!",
-                data = {
-                    "LICENCE": (self.licence_tests, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Get the Gold Medal in licence test LICENCE!",
-                data = {
-                    "LICENCE": (self.licence_tests, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            )
-        ] if self.include_licence_tests else []
-    
-    def get_beginner_events_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium in the RACE!",
-                data = {
-                    "RACE": (self.beginner_events, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the RACE!",
-                data = {
-                    "RACE": (self.beginner_events, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_beginner_events else []
-    
-    def get_professional_events_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium in the RACE!",
-                data = {
-                    "RACE": (self.professional_events, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the RACE!",
-                data = {
-                    "RACE": (self.professional_events, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Become the LEAGUE Champion!",
-                data = {
-                    "LEAGUE": (self.professional_series, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_professional_events else []
-    
-    def get_extreme_events_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium in the RACE!",
-                data = {
-                    "RACE": (self.extreme_events, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = True,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the RACE!",
-                data = {
-                    "RACE": (self.extreme_events, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = True,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Become the LEAGUE Champion!",
-                data = {
-                    "LEAGUE": (self.extreme_series, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = True,
-                weight = 3
-            )
-        ] if self.include_extreme_events else []
-    
-    def get_endurance_events_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium in the RACE!",
-                data = {
-                    "RACE": (self.endurance_events, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the RACE!",
-                data = {
-                    "RACE": (self.endurance_events, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_endurance_events else []
-    
-    def get_special_conditions_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Win the LEVEL RACE!",
-                data = {
-                    "RACE": (self.special_conditions, 1),
-                    "LEVEL": (self.special_conditions_levels, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_special_conditions else []
-    
-    def get_regional_events_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium in the RACE!",
-                data = {
-                    "RACE": (self.regional_events, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the RACE!",
-                data = {
-                    "RACE": (self.regional_events, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Stand on the podium in the RACE!",
-                data = {
-                    "RACE": (self.regional_events_long, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the RACE!",
-                data = {
-                    "RACE": (self.regional_events_long, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Become the LEAGUE Champion!",
-                data = {
-                    "LEAGUE": (self.regional_series, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_regional_events else []
-    
-    def get_manufacturer_events_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Stand on the podium in the RACE!",
-                data = {
-                    "RACE": (self.manufacturer_events, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Win the RACE!",
-                data = {
-                    "RACE": (self.manufacturer_events, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            ),
-            GameObjectiveTemplate(
-                label = "Become the LEAGUE Champion!",
-                data = {
-                    "LEAGUE": (self.manufacturer_series, 1)
-                },
-                is_time_consuming = True,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_manufacturer_events else []
-    
-    def get_driving_missions_objectives(self) -> List[GameObjectiveTemplate]:
-        return (self.get_the_pass_objectives() +
-                self.get_3_lap_battle_objectives() +
-                self.get_slipstream_battle_objectives() +
-                self.get_1_lap_magic_objectives()
-                if self.include_driving_missions else [])
-    
-    def get_the_pass_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Beat Mission MISSION!",
-                data = {
-                    "MISSION": (self.the_pass_missions, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_the_pass_missions else []
-    
-    def get_3_lap_battle_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Beat Mission MISSION!",
-                data = {
-                    "MISSION": (self.three_lap_battle_missions, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = False,
-                weight = 3
-            )
-        ] if self.include_3_lap_battle_missions else []
-    
-    def get_slipstream_battle_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Beat Mission MISSION!",
-                data = {
-                    "MISSION": (self.slipstream_battle_missions, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            )
-        ] if self.include_slipstream_battle_missions else []
-    
-    def get_1_lap_magic_objectives(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label = "Beat Mission MISSION!",
-                data = {
-                    "MISSION": (self.one_lap_magic_missions, 1)
-                },
-                is_time_consuming = False,
-                is_difficult = True,
-                weight = 3
-            )
-        ] if self.include_1_lap_magic_missions else []
\ No newline at end of file
+        return list(self.template_set.templates)
+    
+    def filter_game_objective_templates(
+        self,
+        include_difficult: bool = False,
+        include_time_consuming: bool = False
+    ) -> List[GameObjectiveTemplate]:
+        return list(self.template_set.filter(include_difficult, include_time_consuming))
+    
+    @cached_property
+    def template_set(self) -> TemplateSet:
+        return _template_set(self.options_plan.flags)
+    # End of generated members
+
+# Generated rows from tools/games.json by python -m tools.generate; edit the specification, not this block
+# Each row, split by ";": the section enabling it, its label, the PLACEHOLDER=catalog it fills,
+# is_time_consuming and is_difficult as 1 or 0, its weight and its conflict key, if any
+_objective_rows: Tuple[str, ...] = (
+    "World Circuits;Stand on the podium at TRACK in Arcade Mode!;TRACK=arcade_world_tracks;0;0;3;world_circuit_race",
+    "World Circuits;Win the race at TRACK in Arcade Mode!;TRACK=arcade_world_tracks;0;0;3;world_circuit_race",
+    "Original Circuits;Stand on the podium at TRACK in Arcade Mode!;TRACK=arcade_original_tracks;0;0;3;"
+    "original_circuit_race",
+    "Original Circuits;Win the race at TRACK in Arcade Mode!;TRACK=arcade_original_tracks;0;0;3;original_circuit_race",
+    "City Courses;Stand on the podium at TRACK in Arcade Mode!;TRACK=arcade_city_tracks;0;0;3;city_course_race",
+    "City Courses;Win the race at TRACK in Arcade Mode!;TRACK=arcade_city_tracks;0;0;3;city_course_race",
+    "City Courses;Win the race at TRACK in Arcade Mode!;TRACK=arcade_city_duels;0;1;3;",
+    "Dirt & Snow;Win the race at TRACK in Arcade Mode!;TRACK=arcade_rally_tracks;0;0;3;",
+    "Licenses;Beat the target time in licence test LICENCE!;LICENCE=licence_tests;0;0;3;licence_test",
+    "Licenses;Get the Gold Medal in licence test LICENCE!;LICENCE=licence_tests;0;1;3;licence_test",
+    "Beginner Events;Stand on the podium in the RACE!;RACE=beginner_events;0;0;3;beginner_event_race",
+    "Beginner Events;Win the RACE!;RACE=beginner_events;0;0;3;beginner_event_race",
+    "Professional Events;Stand on the podium in the RACE!;RACE=professional_events;0;0;3;professional_event_race",
+    "Professional Events;Win the RACE!;RACE=professional_events;0;0;3;professional_event_race",
+    "Professional Events;Become the LEAGUE Champion!;LEAGUE=professional_series;1;0;3;",
+    "Extreme Events;Stand on the podium in the RACE!;RACE=extreme_events;1;1;3;extreme_event_race",
+    "Extreme Events;Win the RACE!;RACE=extreme_events;1;1;3;extreme_event_race",
+    "Extreme Events;Become the LEAGUE Champion!;LEAGUE=extreme_series;1;1;3;",
+    "Endurance Events;Stand on the podium in the RACE!;RACE=endurance_events;1;0;3;endurance_event_race",
+    "Endurance Events;Win the RACE!;RACE=endurance_events;1;0;3;endurance_event_race",
+    "Special Conditions;Win the LEVEL RACE!;RACE=special_conditions|LEVEL=special_conditions_levels;0;0;3;",
+    "Regional Events;Stand on the podium in the RACE!;RACE=regional_events;0;0;3;regional_event_race",
+    "Regional Events;Win the RACE!;RACE=regional_events;0;0;3;regional_event_race",
+    "Regional Events;Stand on the podium in the RACE!;RACE=regional_events_long;1;0;3;regional_event_long_race",
+    "Regional Events;Win the RACE!;RACE=regional_events_long;1;0;3;regional_event_long_race",
+    "Regional Events;Become the LEAGUE Champion!;LEAGUE=regional_series;1;0;3;",
+    "Manufacturer Events;Stand on the podium in the RACE!;RACE=manufacturer_events;0;0;3;manufacturer_event_race",
+    "Manufacturer Events;Win the RACE!;RACE=manufacturer_events;0;0;3;manufacturer_event_race",
+    "Manufacturer Events;Become the LEAGUE Champion!;LEAGUE=manufacturer_series;1;0;3;",
+    "The Pass;Beat Mission MISSION!;MISSION=the_pass_missions;0;0;3;",
+    "3 Lap Battle;Beat Mission MISSION!;MISSION=three_lap_battle_missions;0;0;3;",
+    "Slipstream Battle;Beat Mission MISSION!;MISSION=slipstream_battle_missions;0;1;3;",
+    "1 Lap Magic;Beat Mission MISSION!;MISSION=one_lap_magic_missions;0;1;3;"
+)
+# End of generated rows
\ No newline at end of file
@@ -0,0 +1,3 @@
+"""
+Offline benchmarks for the game modules, run against local stand-ins for the Archipelago base classes
+"""
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""
+Records the memory allocated by the objective hot path of every game module and fails when it grows past the
+stored baseline
+
+    python -m benchmarks.allocations            check against benchmarks/allocations.json
+    python -m benchmarks.allocations --update   record a new baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+
+from tools import GAME_MODULES
+
+from .standins import load_game, make_options
+
+BASELINE = Path(__file__).resolve().parent / "allocations.json"
+
+CALLS = 10000
+
+def measure(function: Callable[[], Any]) -> Dict[str, int]:
+    """
+    Blocks and bytes still held after one call, once caches are warm, and the peak reached during it. Whatever the
+    call returns is kept alive until the measurement is taken, so it counts towards the total
+    """
+    function()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    start, _ = tracemalloc.get_traced_memory()
+    result = function()
+    current, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    ignored = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    differences = after.filter_traces(ignored).compare_to(before.filter_traces(ignored), "filename")
+    del result
+    return {
+        "blocks": sum(difference.count_diff for difference in differences),
+        "bytes": sum(difference.size_diff for difference in differences),
+        "peak_bytes": peak - start
+    }
+
+def measure_game(module_name: str) -> Dict[str, Dict[str, int]]:
+    game = load_game(module_name)
+    instance = game(archipelago_options = make_options(game))
+    catalogs = {function for template in instance.game_objective_templates() for function, _ in template.data.values()}
+    
+    def call_catalogs() -> List[Any]:
+        # Holding every result makes each allocation a call makes show up, not just the last call's
+        return [catalog() for catalog in catalogs for _ in range(CALLS)]
+    
+    return {
+        "game_objective_templates": measure(instance.game_objective_templates),
+        f"data_callables_x{CALLS}": measure(call_catalogs)
+    }
+
+def regressions(results: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    found: List[str] = []
+    for module_name, measurements in results.items():
+        for name, measured in measurements.items():
+            expected = baseline.get(module_name, {}).get(name)
+            if expected is None:
+                found.append(f"{module_name} {name}: no baseline recorded")
+                continue
+            for key in ("blocks", "bytes"):
+                if measured[key] > expected[key]:
+                    found.append(f"{module_name} {name}: {key} grew from {expected[key]} to {measured[key]}")
+    return found
+
+def main(arguments: Sequence[str] = ()) -> int:
+    parser = argparse.ArgumentParser(description = __doc__.strip().splitlines()[0])
+    parser.add_argument("--update", action = "store_true", help = "record the measurements as the new baseline")
+    parser.add_argument("--baseline", default = str(BASELINE))
+    options = parser.parse_args(arguments or None)
+    results = {module_name: measure_game(module_name) for module_name in GAME_MODULES}
+    print(json.dumps(results, indent = 2))
+    if options.update:
+        with open(options.baseline, "w", encoding = "utf-8") as output:
+            json.dump({"python": sys.version.split()[0], "games": results}, output, indent = 2)
+        return 0
+    with open(options.baseline, encoding = "utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    if baseline["python"] != sys.version.split()[0]:
+        print(f"Baseline was recorded on Python {baseline['python']}; byte counts may differ", file = sys.stderr)
+    found = regressions(results, baseline["games"])
+    for regression in found:
+        print(regression, file = sys.stderr)
+    return 1 if found else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
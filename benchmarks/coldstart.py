@@ -0,0 +1,188 @@
+"""
+Imports every game module in fresh interpreters against the local stand-ins and reports what a cold start costs:
+import wall time, bytecode compile time, memory allocated by the import, the first game_objective_templates() call,
+and where the import and that first call spend their time
+
+    python -m benchmarks.coldstart --runs 20 --output coldstart.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import json
+import pstats
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from tools import GAME_MODULES, REPOSITORY
+
+from .standins import install, make_options
+
+# Written to standard error around the game module's import, so the breakdown counts nothing imported before or after
+START_MARKER = "coldstart: importing"
+END_MARKER = "coldstart: imported"
+
+def import_game(module_name: str) -> ModuleType:
+    name = f"keymasters_keep.games.{module_name}"
+    print(START_MARKER, file = sys.stderr, flush = True)
+    # An import statement's own path, unlike importlib.import_module, is what -X importtime reports on
+    __import__(name)
+    module = sys.modules[name]
+    print(END_MARKER, file = sys.stderr, flush = True)
+    return module
+
+def first_templates(module: ModuleType, module_name: str) -> None:
+    game = getattr(module, GAME_MODULES[module_name])
+    game(archipelago_options = make_options(game)).game_objective_templates()
+
+def time_worker(module_name: str) -> Dict[str, Any]:
+    source_path = REPOSITORY / f"{module_name}.py"
+    start = time.perf_counter_ns()
+    module = import_game(module_name)
+    imported = time.perf_counter_ns()
+    first_templates(module, module_name)
+    called = time.perf_counter_ns()
+    source = source_path.read_text(encoding = "utf-8")
+    compile_start = time.perf_counter_ns()
+    compile(source, str(source_path), "exec")
+    compiled = time.perf_counter_ns()
+    return {
+        "import_ms": (imported - start) / 1e6,
+        "first_templates_ms": (called - imported) / 1e6,
+        "compile_ms": (compiled - compile_start) / 1e6
+    }
+
+def allocation_worker(module_name: str) -> Dict[str, Any]:
+    tracemalloc.start()
+    module = import_game(module_name)
+    imported, import_peak = tracemalloc.get_traced_memory()
+    import_blocks = sum(statistic.count for statistic in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.reset_peak()
+    first_templates(module, module_name)
+    called, call_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "import_bytes": imported,
+        "import_peak_bytes": import_peak,
+        "import_blocks": import_blocks,
+        "first_templates_bytes": called - imported,
+        "first_templates_peak_bytes": call_peak - imported
+    }
+
+def top_functions(profiler: cProfile.Profile, top: int) -> List[Dict[str, Any]]:
+    entries = sorted(pstats.Stats(profiler).stats.items(), key = lambda entry: entry[1][3], reverse = True)
+    return [
+        {
+            "function": f"{Path(filename).name}:{line}({name})",
+            "calls": calls,
+            "own_ms": own * 1000,
+            "cumulative_ms": cumulative * 1000
+        }
+        for (filename, line, name), (_, calls, own, cumulative, _) in entries[:top]
+    ]
+
+def profile_worker(module_name: str, top: int) -> Dict[str, Any]:
+    profiler = cProfile.Profile()
+    module = profiler.runcall(import_game, module_name)
+    result = {"import": top_functions(profiler, top)}
+    profiler = cProfile.Profile()
+    profiler.runcall(first_templates, module, module_name)
+    result["first_templates"] = top_functions(profiler, top)
+    return result
+
+WORKERS: Dict[str, Callable[[str, int], Dict[str, Any]]] = {
+    "time": lambda module_name, top: time_worker(module_name),
+    "imports": lambda module_name, top: {"module": import_game(module_name).__name__},
+    "allocations": lambda module_name, top: allocation_worker(module_name),
+    "profile": profile_worker
+}
+
+def run_worker(module_name: str, mode: str, top: int) -> Tuple[Dict[str, Any], str]:
+    # -X importtime reports each module pulled in, and how long it took, on standard error. Its own bookkeeping slows
+    # the import down, so only the breakdown runs use it and the timed runs go without
+    flags = ["-X", "importtime"] if mode == "imports" else []
+    completed = subprocess.run(
+        [sys.executable, *flags, "-m", "benchmarks.coldstart",
+         "--worker", module_name, "--mode", mode, "--top", str(top)],
+        capture_output = True, check = True, text = True, cwd = REPOSITORY
+    )
+    return json.loads(completed.stdout), completed.stderr
+
+def import_times(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Self and cumulative microseconds of every module imported between the markers, the game module included
+    """
+    times: Dict[str, Tuple[int, int]] = {}
+    lines = stderr.splitlines()
+    for line in lines[lines.index(START_MARKER) + 1:lines.index(END_MARKER)]:
+        if not line.startswith("import time:"):
+            continue
+        own, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        times[name] = (int(own), int(cumulative))
+    return times
+
+def summary(values: Sequence[float]) -> Dict[str, float]:
+    return {"best": min(values), "median": statistics.median(values), "worst": max(values)}
+
+def profile_module(module_name: str, runs: int, top: int) -> Dict[str, Any]:
+    timings = [run_worker(module_name, "time", top)[0] for _ in range(runs)]
+    imports: Dict[str, List[Tuple[int, int]]] = {}
+    for _ in range(runs):
+        for name, times in import_times(run_worker(module_name, "imports", top)[1]).items():
+            imports.setdefault(name, []).append(times)
+    breakdown = sorted(
+        (
+            {
+                "module": name,
+                "self_us": statistics.median(own for own, _ in times),
+                "cumulative_us": statistics.median(cumulative for _, cumulative in times)
+            }
+            for name, times in imports.items()
+        ),
+        key = lambda entry: entry["self_us"], reverse = True
+    )
+    return {
+        **{
+            key: summary([timing[key] for timing in timings])
+            for key in ("import_ms", "compile_ms", "first_templates_ms")
+        },
+        "allocations": run_worker(module_name, "allocations", top)[0],
+        "import_breakdown": breakdown[:top],
+        "profile": run_worker(module_name, "profile", top)[0]
+    }
+
+def main(arguments: Sequence[str] = ()) -> None:
+    parser = argparse.ArgumentParser(description = __doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type = int, default = 20, help = "fresh interpreters timed per module")
+    parser.add_argument("--top", type = int, default = 15, help = "entries kept in each breakdown")
+    parser.add_argument("--games", nargs = "*", default = list(GAME_MODULES), choices = list(GAME_MODULES))
+    parser.add_argument("--output", help = "where to write the JSON results; standard output if omitted")
+    parser.add_argument("--worker", choices = list(GAME_MODULES), help = argparse.SUPPRESS)
+    parser.add_argument("--mode", choices = list(WORKERS), default = "time", help = argparse.SUPPRESS)
+    options = parser.parse_args(arguments or None)
+    if options.worker is not None:
+        install()
+        print(json.dumps(WORKERS[options.mode](options.worker, options.top)))
+        return
+    results = {
+        "python": sys.version,
+        "runs": options.runs,
+        "games": {module_name: profile_module(module_name, options.runs, options.top) for module_name in options.games}
+    }
+    text = json.dumps(results, indent = 2)
+    if options.output:
+        with open(options.output, "w", encoding = "utf-8") as output:
+            output.write(text)
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
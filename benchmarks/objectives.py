@@ -0,0 +1,111 @@
+"""
+Times objective generation for every game module against the local stand-ins and writes the results as JSON
+
+    python -m benchmarks.objectives --output objectives.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+from random import Random
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Type
+
+from tools import GAME_MODULES
+
+from .standins import Game, OptionSet, load_game, make_options, option_classes, random_options
+
+def time_call(function: Callable[[], Any], repeat: int, number: int) -> Dict[str, float]:
+    """
+    Best and mean time of one call in microseconds, over repeat rounds of number calls each
+    """
+    rounds: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            function()
+        rounds.append((time.perf_counter_ns() - start) / number / 1000)
+    return {"best_us": min(rounds), "mean_us": sum(rounds) / len(rounds)}
+
+def option_combinations(game: Type[Game], random: Random, samples: int) -> List[Tuple[str, SimpleNamespace]]:
+    """
+    The defaults, each mode on its own, the emptiest selection, and a seeded sample of random selections
+    """
+    toggles = [name for name, option in option_classes(game).items() if not issubclass(option, OptionSet)]
+    sets = [name for name, option in option_classes(game).items() if issubclass(option, OptionSet)]
+    combinations = [
+        ("defaults", make_options(game)),
+        ("arcade only", make_options(game, **{toggles[0]: True, toggles[1]: False})),
+        ("career only", make_options(game, **{toggles[0]: False, toggles[1]: True})),
+        ("minimal", make_options(game, **{name: [] for name in sets}))
+    ]
+    combinations.extend((f"random {index + 1}", random_options(game, random)) for index in range(samples))
+    return combinations
+
+def data_callables(templates: Sequence[Any]) -> Dict[str, Callable[[], Any]]:
+    return {
+        function.__name__: function
+        for template in templates for function, _ in template.data.values()
+    }
+
+def benchmark_game(module_name: str, repeat: int, number: int, draws: int, samples: int) -> Dict[str, Any]:
+    game = load_game(module_name)
+    random = Random(0)
+    first = time.perf_counter_ns()
+    game(archipelago_options = make_options(game)).game_objective_templates()
+    result: Dict[str, Any] = {
+        "first_templates_us": (time.perf_counter_ns() - first) / 1000,
+        "combinations": {},
+        "data_callables": {}
+    }
+    all_templates: List[Any] = []
+    for label, options in option_combinations(game, random, samples):
+        instance = game(random = Random(1), archipelago_options = options)
+        templates = instance.game_objective_templates()
+        all_templates.extend(templates)
+        result["combinations"][label] = {
+            "templates": len(templates),
+            "game_objective_templates": time_call(
+                lambda: game(archipelago_options = options).game_objective_templates(), repeat, number
+            ),
+            "keep_draw": time_call(
+                lambda: instance.generate_objectives(draws, include_difficult = True, include_time_consuming = True),
+                repeat, max(1, number // 10)
+            ) if templates else None
+        }
+    for name, function in sorted(data_callables(all_templates).items()):
+        result["data_callables"][name] = {"size": len(function()), **time_call(function, repeat, number)}
+    return result
+
+def main(arguments: Sequence[str] = ()) -> None:
+    parser = argparse.ArgumentParser(description = __doc__.strip().splitlines()[0])
+    parser.add_argument("--output", help = "where to write the JSON results; standard output if omitted")
+    parser.add_argument("--repeat", type = int, default = 5, help = "timing rounds per measurement")
+    parser.add_argument("--number", type = int, default = 1000, help = "calls per timing round")
+    parser.add_argument("--draws", type = int, default = 10, help = "objectives per keep-style draw")
+    parser.add_argument("--samples", type = int, default = 8, help = "random option combinations per game")
+    parser.add_argument("--games", nargs = "*", default = list(GAME_MODULES), choices = list(GAME_MODULES))
+    options = parser.parse_args(arguments or None)
+    results = {
+        "python": sys.version,
+        "platform": platform.platform(),
+        "parameters": {"repeat": options.repeat, "number": options.number, "draws": options.draws},
+        "games": {
+            module_name: benchmark_game(module_name, options.repeat, options.number, options.draws, options.samples)
+            for module_name in options.games
+        }
+    }
+    text = json.dumps(results, indent = 2)
+    if options.output:
+        with open(options.output, "w", encoding = "utf-8") as output:
+            output.write(text)
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
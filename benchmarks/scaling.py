@@ -0,0 +1,102 @@
+"""
+Simulates a multiworld of N players with random options for every game, runs full objective selection for each
+player, and reports throughput, per-player latency and peak memory as N grows
+
+    python -m benchmarks.scaling --players 1 10 100 1000 --output scaling.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from random import Random
+from typing import Any, Dict, List, Sequence
+
+from tools import GAME_MODULES, REPOSITORY
+
+from .standins import Game, load_game, random_options
+
+def peak_rss_kib() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+def percentile(ordered: Sequence[float], fraction: float) -> float:
+    # Nearest rank, so small samples still report one of the measured values
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+def run_players(players: int, objectives: int, seed: int) -> Dict[str, Any]:
+    """
+    Generate every player in this process, keeping their games alive as a generation would
+    """
+    games = [load_game(module_name) for module_name in GAME_MODULES]
+    random = Random(seed)
+    baseline_rss = peak_rss_kib()
+    alive: List[Game] = []
+    latencies: List[float] = []
+    generated = 0
+    start = time.perf_counter()
+    for _ in range(players):
+        player_start = time.perf_counter()
+        for game in games:
+            instance = game(random = Random(random.random()), archipelago_options = random_options(game, random))
+            instance.game_objective_templates()
+            generated += len(instance.generate_objectives(
+                objectives,
+                include_difficult = random.random() < 0.5,
+                include_time_consuming = random.random() < 0.5
+            ))
+            alive.append(instance)
+        latencies.append((time.perf_counter() - player_start) * 1000)
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "players": players,
+        "objectives": generated,
+        "seconds": elapsed,
+        "objectives_per_second": generated / elapsed if elapsed else None,
+        "p50_player_ms": percentile(latencies, 0.5),
+        "p99_player_ms": percentile(latencies, 0.99),
+        "peak_rss_kib": peak_rss_kib(),
+        "rss_growth_kib": peak_rss_kib() - baseline_rss
+    }
+
+def run_isolated(players: int, objectives: int, seed: int) -> Dict[str, Any]:
+    # A fresh interpreter per size keeps peak memory from one size out of the next
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.scaling", "--worker", str(players),
+         "--objectives", str(objectives), "--seed", str(seed)],
+        capture_output = True, check = True, text = True, cwd = REPOSITORY
+    )
+    return json.loads(completed.stdout)
+
+def main(arguments: Sequence[str] = ()) -> None:
+    parser = argparse.ArgumentParser(description = __doc__.strip().splitlines()[0])
+    parser.add_argument("--players", type = int, nargs = "+", default = [1, 10, 50, 100, 250, 500, 1000])
+    parser.add_argument("--objectives", type = int, default = 20, help = "objectives drawn per game per player")
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--output", help = "where to write the JSON results; standard output if omitted")
+    parser.add_argument("--worker", type = int, help = argparse.SUPPRESS)
+    options = parser.parse_args(arguments or None)
+    if options.worker is not None:
+        print(json.dumps(run_players(options.worker, options.objectives, options.seed)))
+        return
+    results = {
+        "python": sys.version,
+        "games": list(GAME_MODULES),
+        "objectives_per_game": options.objectives,
+        "runs": [run_isolated(players, options.objectives, options.seed) for players in options.players]
+    }
+    text = json.dumps(results, indent = 2)
+    if options.output:
+        with open(options.output, "w", encoding = "utf-8") as output:
+            output.write(text)
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
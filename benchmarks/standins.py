@@ -0,0 +1,180 @@
+"""
+Local stand-ins for the parts of Archipelago and Keymaster's Keep the game modules import, so the modules can be
+loaded and measured offline without an Archipelago checkout
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+
+from dataclasses import fields
+from enum import Enum
+from random import Random
+from types import ModuleType, SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from tools import GAME_MODULES, REPOSITORY
+
+class Toggle:
+    default = 0
+    
+    def __init__(self, value: int) -> None:
+        self.value = int(value)
+    
+    @classmethod
+    def from_any(cls, data: Any) -> Toggle:
+        return cls(bool(data))
+
+class DefaultOnToggle(Toggle):
+    default = 1
+
+class OptionSet:
+    valid_keys: Iterable[str] = []
+    default: Iterable[str] = frozenset()
+    
+    def __init__(self, value: Iterable[str]) -> None:
+        self.value = set(value)
+        unknown = self.value.difference(self.valid_keys)
+        if unknown:
+            raise ValueError(f"{type(self).__name__} has no keys {sorted(unknown)}")
+    
+    @classmethod
+    def from_any(cls, data: Iterable[str]) -> OptionSet:
+        return cls(data)
+
+class KeymastersKeepGamePlatforms(Enum):
+    PS1 = "PS1"
+    PS2 = "PS2"
+
+class GameObjectiveTemplate:
+    def __init__(
+        self,
+        label: str,
+        data: Dict[str, Tuple[Any, Any]],
+        is_time_consuming: bool = False,
+        is_difficult: bool = False,
+        weight: int = 1
+    ) -> None:
+        self.label = label
+        self.data = data
+        self.is_time_consuming = is_time_consuming
+        self.is_difficult = is_difficult
+        self.weight = weight
+    
+    def generate_game_objective(self, random: Random) -> str:
+        objective = self.label
+        for key, (collection_callable, quantity) in self.data.items():
+            if isinstance(quantity, range):
+                quantity = random.choice(quantity)
+            objects = random.sample(collection_callable(), quantity)
+            objective = objective.replace(key, ", ".join(str(o) for o in objects), 1)
+        return objective
+
+game_registry: Dict[str, Type[Game]] = {}
+
+class AutoGameRegister(type):
+    def __new__(mcs, name: str, bases: Tuple[type, ...], namespace: Dict[str, Any]) -> type:
+        cls = super().__new__(mcs, name, bases, namespace)
+        if bases:
+            game_registry[cls.name] = cls
+        return cls
+
+class Game(metaclass = AutoGameRegister):
+    name: str
+    platform: KeymastersKeepGamePlatforms
+    is_adult_only_or_unrated: bool = True
+    options_cls: Optional[type] = None
+    
+    def __init__(
+        self,
+        random: Optional[Random] = None,
+        include_time_consuming_objectives: bool = False,
+        include_difficult_objectives: bool = False,
+        archipelago_options: Any = None
+    ) -> None:
+        self.random = random or Random()
+        self.include_time_consuming_objectives = include_time_consuming_objectives
+        self.include_difficult_objectives = include_difficult_objectives
+        self.archipelago_options = archipelago_options
+    
+    def optional_game_constraint_templates(self) -> List[GameObjectiveTemplate]:
+        raise NotImplementedError
+    
+    def game_objective_templates(self) -> List[GameObjectiveTemplate]:
+        raise NotImplementedError
+    
+    def filter_game_objective_templates(
+        self,
+        include_difficult: bool = False,
+        include_time_consuming: bool = False
+    ) -> List[GameObjectiveTemplate]:
+        return [
+            template for template in self.game_objective_templates()
+            if (include_difficult or not template.is_difficult) and
+               (include_time_consuming or not template.is_time_consuming)
+        ]
+    
+    def generate_objectives(
+        self,
+        count: int = 1,
+        include_difficult: bool = False,
+        include_time_consuming: bool = False
+    ) -> List[str]:
+        templates = self.filter_game_objective_templates(include_difficult, include_time_consuming)
+        if not templates:
+            return []
+        weights = [template.weight for template in templates]
+        return [
+            template.generate_game_objective(self.random)
+            for template in self.random.choices(templates, weights = weights, k = count)
+        ]
+
+def install() -> None:
+    """
+    Register the stand-ins under the module names the game modules import from
+    """
+    if "keymasters_keep.games" in sys.modules:
+        return
+    modules = {
+        "Options": {"Toggle": Toggle, "DefaultOnToggle": DefaultOnToggle, "OptionSet": OptionSet},
+        "keymasters_keep": {},
+        "keymasters_keep.game": {"Game": Game, "AutoGameRegister": AutoGameRegister},
+        "keymasters_keep.game_objective_template": {"GameObjectiveTemplate": GameObjectiveTemplate},
+        "keymasters_keep.enums": {"KeymastersKeepGamePlatforms": KeymastersKeepGamePlatforms},
+        "keymasters_keep.games": {}
+    }
+    for name, attributes in modules.items():
+        module = ModuleType(name)
+        module.__dict__.update(attributes)
+        sys.modules[name] = module
+    sys.modules["keymasters_keep"].__path__ = []
+    sys.modules["keymasters_keep.games"].__path__ = [str(REPOSITORY)]
+
+def load_game_module(module_name: str) -> ModuleType:
+    install()
+    return importlib.import_module(f"keymasters_keep.games.{module_name}")
+
+def load_game(module_name: str) -> Type[Game]:
+    return getattr(load_game_module(module_name), GAME_MODULES[module_name])
+
+def option_classes(game: Type[Game]) -> Dict[str, type]:
+    module = sys.modules[game.__module__]
+    return {field.name: getattr(module, field.type) for field in fields(game.options_cls)}
+
+def make_options(game: Type[Game], **values: Any) -> SimpleNamespace:
+    """
+    Build an options object for a game, taking each option's default unless a value is given for it by field name
+    """
+    return SimpleNamespace(**{
+        name: option(values.get(name, option.default)) for name, option in option_classes(game).items()
+    })
+
+def random_options(game: Type[Game], random: Random) -> SimpleNamespace:
+    values: Dict[str, Any] = {}
+    for name, option in option_classes(game).items():
+        if issubclass(option, OptionSet):
+            values[name] = [key for key in option.valid_keys if random.random() < 0.7]
+        else:
+            values[name] = random.random() < 0.85
+    return make_options(game, **values)
\ No newline at end of file
@@ -0,0 +1,3 @@
+"""
+Tests for the game modules and their analysis, run against the local stand-ins with ``python -m pytest``
+"""
\ No newline at end of file
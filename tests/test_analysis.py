@@ -0,0 +1,103 @@
+"""
+The analysis of every game module checked against the slow, obvious way of working out the same thing
+"""
+
+from __future__ import annotations
+
+from itertools import product
+from random import Random
+from typing import List, Set
+
+import pytest
+
+from benchmarks.standins import load_game
+from tools import GAME_MODULES
+from tools.analysis import GameAnalysis, analyse, bucket_number
+
+FILTERS = list(product((False, True), repeat = 2))
+
+@pytest.fixture(params = list(GAME_MODULES))
+def analysis(request: pytest.FixtureRequest) -> GameAnalysis:
+    return analyse(load_game(request.param))
+
+def sample_flags(analysis: GameAnalysis, count: int = 24) -> List[int]:
+    # No section, every section and a seeded sample between them
+    bits = len(analysis.module._sections)
+    random = Random(bits)
+    return [0, (1 << bits) - 1, *(random.getrandbits(bits) for _ in range(count))]
+
+def allowed_rows(
+    analysis: GameAnalysis,
+    flags: int,
+    include_difficult: bool,
+    include_time_consuming: bool
+) -> List[int]:
+    allowed = bucket_number(include_difficult, include_time_consuming)
+    return [index for index in analysis.template_set(flags).rows if analysis.row_bucket(index) & ~allowed == 0]
+
+def conflict_classes(analysis: GameAnalysis, rows: List[int]) -> Set[int]:
+    offsets = analysis.objective_offsets
+    return {analysis.conflict_class(objective) for row in rows for objective in range(offsets[row], offsets[row + 1])}
+
+def test_encode_decode_round_trip(analysis: GameAnalysis) -> None:
+    for objective in range(analysis.objective_count()):
+        row, choices = analysis.decode_objective(objective)
+        assert analysis.encode_objective(row, choices) == objective
+    with pytest.raises(IndexError):
+        analysis.decode_objective(analysis.objective_count())
+
+def test_labels_fill_every_placeholder(analysis: GameAnalysis) -> None:
+    for objective in range(0, analysis.objective_count(), 13):
+        row, _ = analysis.decode_objective(objective)
+        label = analysis.objective_label(objective)
+        assert all(placeholder not in label for placeholder, _ in analysis.row_data(row))
+
+def test_capacity_counts_distinct_conflict_classes(analysis: GameAnalysis) -> None:
+    for flags, (include_difficult, include_time_consuming) in product(sample_flags(analysis), FILTERS):
+        classes = conflict_classes(analysis, allowed_rows(analysis, flags, include_difficult, include_time_consuming))
+        assert analysis.objective_capacity(flags, include_difficult, include_time_consuming) == len(classes)
+        assert analysis.sampler(flags).distinct_objectives(include_difficult, include_time_consuming) == len(classes)
+
+def test_distinct_draws_cover_every_class_once(analysis: GameAnalysis) -> None:
+    random = Random(0)
+    for flags, (include_difficult, include_time_consuming) in product(sample_flags(analysis, 8), FILTERS):
+        rows = allowed_rows(analysis, flags, include_difficult, include_time_consuming)
+        classes = conflict_classes(analysis, rows)
+        sampler = analysis.sampler(flags)
+        drawn = sampler.draw_distinct_ids(random, len(classes), include_difficult, include_time_consuming)
+        assert sorted(map(analysis.conflict_class, drawn)) == sorted(classes)
+        assert all(analysis.decode_objective(objective)[0] in rows for objective in drawn)
+        with pytest.raises(ValueError):
+            sampler.draw_distinct_ids(random, len(classes) + 1, include_difficult, include_time_consuming)
+
+def test_update_template_set_matches_full_rebuild(analysis: GameAnalysis) -> None:
+    template_sets = analysis.module._template_sets
+    previous = analysis.template_set(0)
+    for flags in sample_flags(analysis):
+        updated = analysis.update_template_set(previous, flags)
+        del template_sets[flags]
+        rebuilt = analysis.template_set(flags)
+        assert rebuilt is not updated
+        assert (updated.flags, updated.rows, updated.templates) == (rebuilt.flags, rebuilt.rows, rebuilt.templates)
+        previous = updated
+
+def test_buckets_match_linear_filter(analysis: GameAnalysis) -> None:
+    for flags, (include_difficult, include_time_consuming) in product(sample_flags(analysis), FILTERS):
+        template_set = analysis.template_set(flags)
+        linear = [
+            template for template in template_set.templates
+            if (include_difficult or not template.is_difficult)
+            and (include_time_consuming or not template.is_time_consuming)
+        ]
+        assert list(template_set.filter(include_difficult, include_time_consuming)) == linear
+        allowed = bucket_number(include_difficult, include_time_consuming)
+        buckets = [
+            template for bucket in product((False, True), repeat = 2) if bucket_number(*bucket) & ~allowed == 0
+            for template in analysis.bucket(flags, *bucket)
+        ]
+        assert sorted(map(id, buckets)) == sorted(map(id, linear))
+        objectives = sum(
+            analysis.row_objective_count(index)
+            for index in allowed_rows(analysis, flags, include_difficult, include_time_consuming)
+        )
+        assert analysis.filtered_objective_count(flags, include_difficult, include_time_consuming) == objectives
\ No newline at end of file
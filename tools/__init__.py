@@ -0,0 +1,19 @@
+"""
+Build steps for the game modules, run from the repository root with ``python -m tools.<name>``, and the analysis
+of their objectives in ``tools.analysis``
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict
+
+REPOSITORY = Path(__file__).resolve().parent.parent
+
+# Each game module, by file name, and the game class it defines
+GAME_MODULES: Dict[str, str] = {
+    "GranTurismo1": "GranTurismo",
+    "GranTurismo2": "GranTurismo2",
+    "GranTurismo3": "GranTurismo3",
+    "GranTurismo4": "GranTurismo4"
+}
\ No newline at end of file
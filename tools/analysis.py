@@ -0,0 +1,373 @@
+"""
+What Keymaster's Keep never asks of a game module, worked out from the module's objective rows: a stable id for every
+concrete objective, conflict classes, capacities, template set updates and constant time sampling. It is kept out of
+the game modules so that they compile and run only what the keep needs
+
+    from tools.analysis import analyse
+    
+    analysis = analyse(GranTurismo4)
+    sampler = analysis.sampler(game.options_plan.flags)
+    objectives = sampler.draw_distinct(random, 10, include_difficult = True)
+"""
+
+from __future__ import annotations
+
+import sys
+
+from bisect import bisect_right
+from fractions import Fraction
+from functools import cache, cached_property
+from itertools import accumulate
+from math import prod
+from random import Random
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:
+    # The rows of each conflict group, and where each group's classes start followed by the number of classes
+    ConflictClasses = Tuple[Tuple[Tuple[int, ...], ...], Tuple[int, ...]]
+
+def bucket_number(difficult: bool, time_consuming: bool) -> int:
+    # Templates fall into four buckets numbered this way; a filter allows every bucket whose bits it includes
+    return difficult | time_consuming << 1
+
+def parse_row(row: str) -> Tuple[Any, ...]:
+    # The fields of a module's objective row, in the order it packs them
+    section, label, data, is_time_consuming, is_difficult, weight, conflict = row.split(";")
+    return section, label, data, is_time_consuming == "1", is_difficult == "1", int(weight), conflict or None
+
+class AliasTable:
+    """
+    Vose's alias method: draws an index with probability proportional to its weight, in constant time
+    """
+    __slots__ = ("probabilities", "aliases")
+    
+    def __init__(self, weights: Sequence[int]) -> None:
+        count = len(weights)
+        total = sum(weights)
+        scaled = [weight * count / total for weight in weights]
+        probabilities = [1.0] * count
+        aliases = list(range(count))
+        small = [index for index, probability in enumerate(scaled) if probability < 1]
+        large = [index for index, probability in enumerate(scaled) if probability >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probabilities[less] = scaled[less]
+            aliases[less] = more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+        self.probabilities = tuple(probabilities)
+        self.aliases = tuple(aliases)
+    
+    def draw(self, random: Random) -> int:
+        column = random.randrange(len(self.probabilities))
+        return column if random.random() < self.probabilities[column] else self.aliases[column]
+
+class GameAnalysis:
+    """
+    The objective ids, conflict classes and capacities of one loaded game module, each worked out once from its rows.
+    Template sets are the module's own, shared with its game instances
+    """
+    def __init__(self, module: ModuleType) -> None:
+        self.module = module
+        self.rows = tuple(map(parse_row, module._objective_rows))
+        # Held weakly, like the module's template sets, so a sampler lives only while something uses it
+        self.samplers: WeakValueDictionary[int, ObjectiveSampler] = WeakValueDictionary()
+    
+    def row_data(self, index: int) -> Tuple[Tuple[str, str], ...]:
+        # Each placeholder of the row with the name of the catalog behind it
+        return tuple((placeholder, catalog) for placeholder, catalog in self.module._pairs(self.rows[index][2]))
+    
+    @cache
+    def row_catalogs(self, index: int) -> Tuple[Sequence[Any], ...]:
+        return tuple(self.module._catalogs[catalog]() for _, catalog in self.row_data(index))
+    
+    def row_bucket(self, index: int) -> int:
+        _, _, _, is_time_consuming, is_difficult, _, _ = self.rows[index]
+        return bucket_number(is_difficult, is_time_consuming)
+    
+    def row_objective_count(self, index: int) -> int:
+        return prod(len(catalog) for catalog in self.row_catalogs(index))
+    
+    @cached_property
+    def objective_offsets(self) -> Tuple[int, ...]:
+        # Where each row's objectives start in the id space, followed by the total number of objectives
+        return tuple(accumulate(map(self.row_objective_count, range(len(self.rows))), initial = 0))
+    
+    def objective_count(self) -> int:
+        return self.objective_offsets[-1]
+    
+    def encode_objective(self, row: int, choices: Sequence[int]) -> int:
+        """
+        The stable id of the objective made by filling each placeholder of an objective row with the chosen entry
+        """
+        objective = 0
+        for choice, catalog in zip(choices, self.row_catalogs(row)):
+            if not 0 <= choice < len(catalog):
+                raise IndexError("catalog index out of range")
+            objective = objective * len(catalog) + choice
+        return self.objective_offsets[row] + objective
+    
+    def objective_row(self, objective: int) -> int:
+        if not 0 <= objective < self.objective_offsets[-1]:
+            raise IndexError("objective id out of range")
+        return bisect_right(self.objective_offsets, objective) - 1
+    
+    def decode_objective(self, objective: int) -> Tuple[int, Tuple[int, ...]]:
+        """
+        The objective row and the catalog entry chosen for each placeholder behind an objective id
+        """
+        row = self.objective_row(objective)
+        remainder = objective - self.objective_offsets[row]
+        choices: List[int] = []
+        for catalog in reversed(self.row_catalogs(row)):
+            remainder, choice = divmod(remainder, len(catalog))
+            choices.append(choice)
+        return row, tuple(reversed(choices))
+    
+    def objective_label(self, objective: int) -> str:
+        row, choices = self.decode_objective(objective)
+        label = self.rows[row][1]
+        for (placeholder, _), catalog, choice in zip(self.row_data(row), self.row_catalogs(row), choices):
+            label = label.replace(placeholder, str(catalog[choice]), 1)
+        return label
+    
+    @cached_property
+    def row_groups(self) -> Tuple[int, ...]:
+        # Rows the specification gives the same conflict key, such as standing on the podium in and winning the same
+        # race, form a conflict group; a row without one is a group of its own
+        groups: Dict[Any, int] = {}
+        return tuple(
+            groups.setdefault(index if conflict is None else conflict, len(groups))
+            for index, (*_, conflict) in enumerate(self.rows)
+        )
+    
+    @cached_property
+    def group_offsets(self) -> Tuple[int, ...]:
+        # Where each conflict group's classes start, followed by the total number of conflict classes
+        counts = {group: self.row_objective_count(index) for index, group in enumerate(self.row_groups)}
+        return tuple(accumulate((counts[group] for group in range(len(counts))), initial = 0))
+    
+    def conflict_class(self, objective: int) -> int:
+        """
+        Objectives sharing a conflict class make each other redundant, so at most one of them belongs in a keep
+        """
+        row = self.objective_row(objective)
+        return self.group_offsets[self.row_groups[row]] + objective - self.objective_offsets[row]
+    
+    def conflicts(self, objective: int, other: int) -> bool:
+        return self.conflict_class(objective) == self.conflict_class(other)
+    
+    @cached_property
+    def section_rows(self) -> Tuple[Tuple[int, ...], ...]:
+        # The rows of each section, in the order of the module's _sections, which is the order of the flags' bits
+        return tuple(
+            tuple(index for index, row in enumerate(self.rows) if row[0] == section)
+            for section in self.module._sections
+        )
+    
+    @cached_property
+    def capacity_tables(self) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+        """
+        For each byte of the flags, the distinct objectives every value of that byte enables under each filter. A
+        section's conflict group counts once if any of its rows passes the filter
+        """
+        sections = [[0] * 4 for _ in self.module._sections]
+        for allowed in range(4):
+            counted = set()
+            for index, group in enumerate(self.row_groups):
+                if self.row_bucket(index) & ~allowed == 0 and group not in counted:
+                    counted.add(group)
+                    size = self.group_offsets[group + 1] - self.group_offsets[group]
+                    sections[self.module._sections.index(self.rows[index][0])][allowed] += size
+        return tuple(
+            tuple(
+                tuple(
+                    sum(counts[allowed] for bit, counts in enumerate(byte) if value >> bit & 1) for allowed in range(4)
+                )
+                for value in range(256)
+            )
+            for byte in (sections[start:start + 8] for start in range(0, len(sections), 8))
+        )
+    
+    def objective_capacity(
+        self,
+        flags: int,
+        include_difficult: bool = False,
+        include_time_consuming: bool = False
+    ) -> int:
+        """
+        How many distinct objectives, counting each conflict class once, the options behind flags can supply under a
+        difficulty filter. One table lookup per byte of the flags, so options leaving a game too little to draw can be
+        caught before generation rather than through retries
+        """
+        allowed = bucket_number(include_difficult, include_time_consuming)
+        return sum(table[flags >> 8 * byte & 0xFF][allowed] for byte, table in enumerate(self.capacity_tables))
+    
+    def template_set(self, flags: int) -> Any:
+        return self.module._template_set(flags)
+    
+    def update_template_set(self, previous: Any, flags: int) -> Any:
+        """
+        The template set for flags, worked out from one built earlier by adding and dropping only the rows of sections
+        whose bits differ, for tools that refresh a preview as a player edits their options. It is registered with the
+        module, so game instances with those options share it
+        """
+        template_sets = self.module._template_sets
+        template_set = template_sets.get(flags)
+        if template_set is None:
+            rows = set(previous.rows)
+            changed = previous.flags ^ flags
+            for bit in range(changed.bit_length()):
+                if changed >> bit & 1:
+                    (rows.update if flags >> bit & 1 else rows.difference_update)(self.section_rows[bit])
+            template_set = template_sets[flags] = self.module.TemplateSet(flags, tuple(sorted(rows)))
+        return template_set
+    
+    @cache
+    def bucket(self, flags: int, is_difficult: bool, is_time_consuming: bool) -> Tuple[Any, ...]:
+        # The templates of one bucket exactly, where a filter allows every bucket it includes
+        template_set = self.template_set(flags)
+        bucket = bucket_number(is_difficult, is_time_consuming)
+        return tuple(
+            template for index, template in zip(template_set.rows, template_set.templates)
+            if self.row_bucket(index) == bucket
+        )
+    
+    @cache
+    def bucket_objectives(self, flags: int) -> Tuple[int, ...]:
+        # Concrete objectives per bucket, indexed as bucket_number numbers them; counting builds the catalogs involved
+        counts = [0, 0, 0, 0]
+        for index in self.template_set(flags).rows:
+            counts[self.row_bucket(index)] += self.row_objective_count(index)
+        return tuple(counts)
+    
+    def filtered_objective_count(self, flags: int, include_difficult: bool, include_time_consuming: bool) -> int:
+        allowed = bucket_number(include_difficult, include_time_consuming)
+        return sum(count for bucket, count in enumerate(self.bucket_objectives(flags)) if bucket & ~allowed == 0)
+    
+    def sampler(self, flags: int) -> ObjectiveSampler:
+        sampler = self.samplers.get(flags)
+        if sampler is None:
+            sampler = self.samplers[flags] = ObjectiveSampler(self, flags)
+        return sampler
+
+@cache
+def analyse(game: type) -> GameAnalysis:
+    """
+    The analysis of the module defining a game class, which must already be loaded
+    """
+    return GameAnalysis(sys.modules[game.__module__])
+
+class ObjectiveSampler:
+    """
+    Constant time weighted draws over everything one options plan allows. Templates are drawn by weight, as
+    Keymaster's Keep does; by_objective instead weights each template by how many objectives it can produce. Distinct
+    draws take the same difficulty filter as filter_game_objective_templates
+    """
+    def __init__(self, analysis: GameAnalysis, flags: int) -> None:
+        self.analysis = analysis
+        self.template_set = analysis.template_set(flags)
+        self.rows = self.template_set.rows
+        self.templates = self.template_set.templates
+        self.template_weights = tuple(analysis.rows[index][5] for index in self.rows)
+        self.objective_counts = tuple(map(analysis.row_objective_count, self.rows))
+        self.objective_weights = tuple(
+            weight * count for weight, count in zip(self.template_weights, self.objective_counts)
+        )
+        self.template_table = AliasTable(self.template_weights)
+        self.objective_table = AliasTable(self.objective_weights)
+        self.filtered_classes: List[Optional[ConflictClasses]] = [None, None, None, None]
+    
+    def draw_template(self, random: Random) -> Any:
+        return self.templates[self.template_table.draw(random)]
+    
+    def draw_id(self, random: Random, by_objective: bool = False) -> int:
+        table = self.objective_table if by_objective else self.template_table
+        index = self.rows[table.draw(random)]
+        offsets = self.analysis.objective_offsets
+        return random.randrange(offsets[index], offsets[index + 1])
+    
+    def draw(self, random: Random, by_objective: bool = False) -> str:
+        return self.analysis.objective_label(self.draw_id(random, by_objective))
+    
+    def conflict_classes(self, include_difficult: bool, include_time_consuming: bool) -> ConflictClasses:
+        """
+        The conflict groups among the rows a difficulty filter allows: each group's allowed rows, and where each
+        group's classes start, followed by the number of classes
+        """
+        allowed = bucket_number(include_difficult, include_time_consuming)
+        classes = self.filtered_classes[allowed]
+        if classes is None:
+            row_groups = self.analysis.row_groups
+            rows = [index for index in self.rows if self.analysis.row_bucket(index) & ~allowed == 0]
+            groups = dict.fromkeys(row_groups[index] for index in rows)
+            group_rows = tuple(tuple(index for index in rows if row_groups[index] == group) for group in groups)
+            class_starts = tuple(
+                accumulate((self.analysis.row_objective_count(members[0]) for members in group_rows), initial = 0)
+            )
+            classes = self.filtered_classes[allowed] = (group_rows, class_starts)
+        return classes
+    
+    def distinct_objectives(self, include_difficult: bool = False, include_time_consuming: bool = False) -> int:
+        # How many objectives the filter allows drawing together without any two conflicting, which is always the
+        # objective_capacity of the same flags under the same filter
+        return self.conflict_classes(include_difficult, include_time_consuming)[1][-1]
+    
+    def class_objective(
+        self,
+        random: Random,
+        position: int,
+        include_difficult: bool = False,
+        include_time_consuming: bool = False
+    ) -> int:
+        # Positions number the filter's conflict classes contiguously; any one member of a class the filter allows
+        # stands for it
+        group_rows, class_starts = self.conflict_classes(include_difficult, include_time_consuming)
+        group = bisect_right(class_starts, position) - 1
+        row = random.choice(group_rows[group])
+        return self.analysis.objective_offsets[row] + position - class_starts[group]
+    
+    def draw_distinct_ids(
+        self,
+        random: Random,
+        count: int,
+        include_difficult: bool = False,
+        include_time_consuming: bool = False
+    ) -> List[int]:
+        """
+        Draw count objectives the filter allows, no two of them conflicting, with a partial Fisher-Yates shuffle of
+        the filter's conflict classes that touches only the positions it swaps
+        """
+        available = self.distinct_objectives(include_difficult, include_time_consuming)
+        if count > available:
+            raise ValueError(f"Only {available} non-conflicting objectives are available, but {count} were requested")
+        swapped: Dict[int, int] = {}
+        drawn: List[int] = []
+        for position in range(count):
+            pick = random.randrange(position, available)
+            drawn.append(
+                self.class_objective(random, swapped.get(pick, pick), include_difficult, include_time_consuming)
+            )
+            swapped[pick] = swapped.get(position, position)
+        return drawn
+    
+    def draw_distinct(
+        self,
+        random: Random,
+        count: int,
+        include_difficult: bool = False,
+        include_time_consuming: bool = False
+    ) -> List[str]:
+        drawn = self.draw_distinct_ids(random, count, include_difficult, include_time_consuming)
+        return [self.analysis.objective_label(objective) for objective in drawn]
+    
+    def section_probabilities(self, by_objective: bool = False) -> Dict[str, Fraction]:
+        weights = self.objective_weights if by_objective else self.template_weights
+        total = sum(weights)
+        probabilities: Dict[str, Fraction] = {}
+        for index, weight in zip(self.rows, weights):
+            section = self.analysis.rows[index][0]
+            probabilities[section] = probabilities.get(section, Fraction(0)) + Fraction(weight, total)
+        return probabilities
\ No newline at end of file
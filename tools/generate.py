@@ -0,0 +1,391 @@
+"""
+Rewrites the game modules from one specification, tools/games.json: the option classes and the plan resolving them,
+the game class members built on that plan, every catalog as a literal and the objective template rows. The engine,
+from tools/engine.py.in, is copied the same way into every module, so the copies cannot drift apart
+
+    python -m tools.generate            rewrite the generated blocks of every module
+    python -m tools.generate --check    exit with an error if any file is out of date with its sources
+
+Each generated block sits between a "# Generated ..." line and an "# End of generated ..." line naming it. Adding a
+series or an objective means editing the specification and running the generator, never editing those blocks.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import re
+import sys
+
+from os.path import commonprefix
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Set, Tuple
+
+from . import GAME_MODULES, REPOSITORY
+
+SPECIFICATION = Path(__file__).resolve().parent / "games.json"
+
+ENGINE = Path(__file__).resolve().parent / "engine.py.in"
+
+WIDTH = 120
+
+# What each block is generated from, and what to edit instead of it, when that is not the specification
+BLOCK_SOURCES: Dict[str, Tuple[str, str]] = {"engine": ("tools/engine.py.in", "tools/engine.py.in")}
+
+# The fields after each row's section, label and data, in the order the modules unpack them, with their defaults
+ROW_FIELDS = (("is_time_consuming", False), ("is_difficult", False), ("weight", 3), ("conflict", None))
+
+def quote(text: str) -> str:
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+def fill(items: Sequence[str], indent: str) -> List[str]:
+    """
+    Items joined with commas into as few lines as fit the line width
+    """
+    lines: List[str] = []
+    line = ""
+    for index, item in enumerate(items):
+        item += "," if index < len(items) - 1 else ""
+        if line and len(indent) + len(line) + 1 + len(item) > WIDTH:
+            lines.append(indent + line)
+            line = item
+        else:
+            line = f"{line} {item}" if line else item
+    if line:
+        lines.append(indent + line)
+    return lines
+
+def bracketed(opening: str, items: Sequence[str], closing: str, indent: str, one_per_line: bool = False) -> List[str]:
+    single = f"{indent}{opening}{', '.join(items)}{closing}"
+    if len(single) <= WIDTH and not one_per_line:
+        return [single]
+    if one_per_line:
+        inner = [f"{indent}    {item}," for item in items[:-1]] + [f"{indent}    {items[-1]}"]
+    else:
+        inner = fill(items, indent + "    ")
+    return [f"{indent}{opening}", *inner, f"{indent}{closing}"]
+
+def packed(entries: Sequence[str], indent: str, separator: str = "|", width: int = WIDTH) -> List[str]:
+    """
+    The entries joined with the separator into one string, split over as few lines as fit the line width. Compiling a
+    module without a .pyc costs by the token, so a catalog is one token here rather than two for every name in a tuple
+    """
+    if any(separator in entry for entry in entries):
+        raise ValueError(f"Entries may not contain {separator}: {[entry for entry in entries if separator in entry]}")
+    lines: List[str] = []
+    chunk = ""
+    for index, entry in enumerate(entries):
+        entry += separator if index < len(entries) - 1 else ""
+        if chunk and len(indent + quote(chunk + entry)) > width:
+            lines.append(indent + quote(chunk))
+            chunk = ""
+        chunk += entry
+    return lines + [indent + quote(chunk)]
+
+def pairs(mapping: Dict[str, Any]) -> List[str]:
+    if any("=" in key for key in mapping):
+        raise ValueError(f"Names may not contain =: {[key for key in mapping if '=' in key]}")
+    return [f"{key}={value}" for key, value in mapping.items()]
+
+def names_used(node: ast.AST) -> Set[str]:
+    return {child.id for child in ast.walk(node) if isinstance(child, ast.Name)}
+
+def names_defined(node: ast.stmt) -> Set[str]:
+    if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+        return {node.name}
+    if isinstance(node, ast.Assign):
+        return {target.id for target in node.targets if isinstance(target, ast.Name)}
+    if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+        return {node.target.id}
+    return set()
+
+def statement_chunks(lines: List[str], body: List[ast.stmt], start: int) -> List[Tuple[ast.stmt, List[str]]]:
+    # Each statement with the lines since the one before it, so its comments and blank lines go with it
+    chunks: List[Tuple[ast.stmt, List[str]]] = []
+    for node in body:
+        chunks.append((node, lines[start:node.end_lineno]))
+        start = node.end_lineno
+    return chunks
+
+def generate_engine(source: str) -> List[str]:
+    """
+    The statements of the engine that the rest of the module needs, directly or through one another, importing only
+    the names they use, so that a module compiles nothing it leaves unused
+    """
+    with open(ENGINE, encoding = "utf-8") as engine_file:
+        engine = engine_file.read()
+    tree = ast.parse(engine)
+    lines = engine.splitlines()
+    # The docstring introduces the template rather than any module, so it is left out
+    chunks = statement_chunks(lines, tree.body[1:], tree.body[0].end_lineno)
+    definitions = [statement for statement, _ in chunks if names_defined(statement)]
+    needed = names_used(ast.parse(block_pattern("engine").sub("", source)))
+    kept: Set[ast.stmt] = set()
+    found = [node for node in definitions if names_defined(node) & needed]
+    while found:
+        kept.update(found)
+        needed.update(*map(names_used, found))
+        found = [node for node in definitions if node not in kept and names_defined(node) & needed]
+    generated: List[str] = []
+    for statement, chunk in chunks:
+        # A statement left out leaves only its blank lines, which still separate the groups around it
+        output = [line for line in chunk if not line]
+        if isinstance(statement, ast.ImportFrom):
+            names = [alias.name for alias in statement.names if alias.name in needed]
+            if statement.module == "__future__" or len(names) == len(statement.names):
+                output = chunk
+            elif names:
+                module = "." * statement.level + (statement.module or "")
+                output = [*chunk[:-1], f"from {module} import {', '.join(names)}"]
+        elif statement in kept:
+            output = chunk
+        generated.extend(output)
+    # Runs of blank lines close up, and none lead
+    return [line for index, line in enumerate(generated) if line or index and generated[index - 1]]
+
+def option_names(game: Dict[str, Any]) -> List[str]:
+    # Each option's name on the plan and the game class: its field, less the prefix every field of the game shares
+    fields = [option["field"] for option in game["options"]]
+    prefix = commonprefix(fields)
+    prefix = prefix[:prefix.rindex("_") + 1]
+    return [field[len(prefix):] for field in fields]
+
+def option_gate(game: Dict[str, Any], section: str) -> List[str]:
+    """
+    The conditions on the options that enable a section: the toggle naming it, or the key of the set holding it, along
+    with whatever enables that set in turn
+    """
+    for name, option in zip(option_names(game), game["options"]):
+        if option.get("section") == section:
+            return [name]
+        if section in option.get("valid_keys", ()):
+            return [*option_gate(game, option["within"]), f"{quote(section)} in {name}"]
+    raise ValueError(f"{game['class']}: no option enables {section}")
+
+def generate_options(game: Dict[str, Any]) -> List[str]:
+    # Keymaster's Keep merges the options of every game into one dataclass of its own, which makes the methods, so
+    # none are made here; the docstring spares dataclass working one out from a signature
+    lines = [
+        "@dataclass(init = False, repr = False, eq = False)",
+        f"class {game['prefix']}APOptions:",
+        '    """',
+        f"    The options {game['prefix']} adds to Keymaster's Keep",
+        '    """'
+    ]
+    lines.extend(f"    {option['field']}: {option['class']}" for option in game["options"])
+    for option in game["options"]:
+        lines.extend(["", f"class {option['class']}({option['type']}):", '    """'])
+        lines.extend(f"    {line}" for line in option["doc"])
+        lines.extend(['    """', f"    display_name = {quote(option['display_name'])}"])
+        if "valid_keys" in option:
+            lines.extend(bracketed("valid_keys = [", [quote(key) for key in option["valid_keys"]], "]", "    "))
+            lines.append("    default = valid_keys")
+    return lines + generate_plan(game)
+
+def generate_plan(game: Dict[str, Any]) -> List[str]:
+    """
+    The plan the game class resolves its options into: a tuple of the options followed by their flags, one bit per
+    section in the order of _sections, worked out once as the plan is made
+    """
+    prefix = game["prefix"]
+    names = option_names(game)
+    lines = [
+        "",
+        f"class {prefix}OptionsPlan(tuple):",
+        '    """',
+        "    The player's options for this game, resolved once so objective generation never walks the options again.",
+        "    Immutable, so the flags worked out as it is made always match the options",
+        '    """',
+        "    __slots__ = ()",
+        "    ",
+        f"    def __new__(cls, options: {prefix}APOptions) -> {prefix}OptionsPlan:"
+    ]
+    lines.extend(
+        f"        {name} = {'bool' if 'valid_keys' not in option else 'frozenset'}(options.{option['field']}.value)"
+        for name, option in zip(names, game["options"])
+    )
+    lines.extend([
+        "        # One bit per entry in _sections, in the same order. Settings switched off by a mode toggle are left",
+        "        # out, so equivalent plans share a key",
+        "        flags = ("
+    ])
+    terms: List[List[str]] = []
+    bit = 0
+    for name, option in zip(names, game["options"]):
+        if "valid_keys" not in option:
+            terms.append([f"{name} << {bit}" if bit else name])
+            bit += 1
+            continue
+        bits = f"_key_bits({option['class']}.valid_keys, {name}) << {bit}"
+        condition = " and ".join(option_gate(game, option["within"]))
+        term = f"({bits} if {condition} else 0)"
+        if len(f"{' ' * 12}{term} |") <= WIDTH:
+            terms.append([term])
+        else:
+            terms.append(["(", f"    {bits}", f"    if {condition} else 0", ")"])
+        bit += len(option["valid_keys"])
+    for index, term in enumerate(terms):
+        term[-1] += " |" if index < len(terms) - 1 else ""
+        lines.extend(f"            {line}" for line in term)
+    lines.extend([
+        "        )",
+        *bracketed("return tuple.__new__(cls, (", [*names, "flags"], "))", "        "),
+        "    ",
+        "    def __reduce__(self) -> Tuple[Any, ...]:",
+        "        # Copies and pickles are made from the fields, as the options are not kept",
+        "        return tuple.__new__, (type(self), tuple(self))",
+        "    ",
+        *(f"    {name} = property(itemgetter({index}))" for index, name in enumerate([*names, "flags"])),
+        ""
+    ])
+    sections = [
+        quote(option["section"]) if "valid_keys" not in option else f"*{option['class']}.valid_keys"
+        for option in game["options"]
+    ]
+    lines.extend(bracketed("_sections: Tuple[str, ...] = (", sections, ")", ""))
+    return lines
+
+def generate_members(game: Dict[str, Any]) -> List[str]:
+    # The game class body after its options: the plan and its options, the catalogs and the keep's entry points
+    prefix = game["prefix"]
+    lines = [
+        "    @cached_property",
+        f"    def options_plan(self) -> {prefix}OptionsPlan:",
+        f"        return {prefix}OptionsPlan(self.archipelago_options)",
+        "    "
+    ]
+    for name, option in zip(option_names(game), game["options"]):
+        lines.extend([
+            "    @property",
+            f"    def {name}(self) -> {'bool' if 'valid_keys' not in option else 'FrozenSet[str]'}:",
+            f"        return self.options_plan.{name}",
+            "    "
+        ])
+    for name, catalog in game["catalogs"].items():
+        # Data for _catalog to build on first use: constants, rather than a function per catalog
+        opening = f"    {name} = _catalog({quote(name)}, "
+        if "range" in catalog:
+            lines.append(f"{opening}range, {catalog['range'][0]}, {catalog['range'][1]})")
+            continue
+        if "items" in catalog:
+            opening += "_names, "
+            entries = packed(catalog["items"], "        ")
+        else:
+            opening += f"SeriesRaces, name, {quote(catalog['section'])}, "
+            entries = packed(pairs(catalog["series"]), "        ")
+        if len(entries) == 1 and len(opening + entries[0].lstrip() + ")") <= WIDTH:
+            lines.append(opening + entries[0].lstrip() + ")")
+        else:
+            lines.extend([f"{opening}(", *entries, "    ))"])
+    lines.append("    ")
+    lines.extend([
+        "    def optional_game_constraint_templates(self) -> List[GameObjectiveTemplate]:",
+        "        return []",
+        "    ",
+        "    def game_objective_templates(self) -> List[GameObjectiveTemplate]:",
+        "        return list(self.template_set.templates)",
+        "    ",
+        "    def filter_game_objective_templates(",
+        "        self,",
+        "        include_difficult: bool = False,",
+        "        include_time_consuming: bool = False",
+        "    ) -> List[GameObjectiveTemplate]:",
+        "        return list(self.template_set.filter(include_difficult, include_time_consuming))",
+        "    ",
+        "    @cached_property",
+        "    def template_set(self) -> TemplateSet:",
+        "        return _template_set(self.options_plan.flags)"
+    ])
+    return lines
+
+def generate_rows(game: Dict[str, Any]) -> List[str]:
+    # One string per row, so a row costs the compiler a token or two rather than one for every field
+    lines = [
+        "# Each row, split by \";\": the section enabling it, its label, the PLACEHOLDER=catalog it fills,",
+        "# is_time_consuming and is_difficult as 1 or 0, its weight and its conflict key, if any",
+        "_objective_rows: Tuple[str, ...] = ("
+    ]
+    conflicts: Dict[str, Dict[str, Any]] = {}
+    for row in game["rows"]:
+        if "conflict" not in row:
+            continue
+        # Members of a conflict group stand in for one another objective by objective, so they must enable together
+        # and fill their placeholders from the same catalogs
+        first = conflicts.setdefault(row["conflict"], row)
+        if (first["section"], list(first["data"].values())) != (row["section"], list(row["data"].values())):
+            raise ValueError(f"{game['class']}: rows in conflict group {row['conflict']} differ in section or catalogs")
+    for index, row in enumerate(game["rows"]):
+        fields = (row.get(field, default) for field, default in ROW_FIELDS)
+        values = (
+            "" if value is None else str(int(value)) if isinstance(value, bool) else str(value) for value in fields
+        )
+        entries = [row["section"], row["label"], "|".join(pairs(row["data"])), *values]
+        # Leaving room for the comma after the row
+        lines.extend(packed(entries, "    ", ";", WIDTH - 1))
+        if index < len(game["rows"]) - 1:
+            lines[-1] += ","
+    lines.append(")")
+    return lines
+
+# The blocks generated from the specification. The engine block follows from what the others use, so it comes last
+MODULE_BLOCKS: Dict[str, Callable[[Dict[str, Any]], List[str]]] = {
+    "options": generate_options,
+    "members": generate_members,
+    "rows": generate_rows
+}
+
+def block_pattern(block: str) -> re.Pattern:
+    return re.compile(
+        rf"^( *)# Generated {block} from .*?^ *# End of generated {block}(?=\r?$)",
+        re.MULTILINE | re.DOTALL
+    )
+
+def generate_blocks(source: str, blocks: Dict[str, List[str]]) -> str:
+    newline = "\r\n" if "\r\n" in source else "\n"
+    for block, generated in blocks.items():
+        origin, edit = BLOCK_SOURCES.get(block, ("tools/games.json", "the specification"))
+        match = block_pattern(block).search(source)
+        if match is None:
+            raise ValueError(f"No generated {block} block found")
+        indent = match.group(1)
+        lines = [
+            f"{indent}# Generated {block} from {origin} by python -m tools.generate; edit {edit}, not this block",
+            *generated,
+            f"{indent}# End of generated {block}"
+        ]
+        source = source[:match.start()] + newline.join(lines) + source[match.end():]
+    return source
+
+def main(arguments: Sequence[str] = ()) -> int:
+    parser = argparse.ArgumentParser(description = __doc__.strip().splitlines()[0])
+    parser.add_argument("--check", action = "store_true", help = "report out-of-date files instead of rewriting them")
+    parser.add_argument("--games", nargs = "*", default = list(GAME_MODULES), choices = list(GAME_MODULES))
+    options = parser.parse_args(arguments or None)
+    with open(SPECIFICATION, encoding = "utf-8") as specification_file:
+        specification = json.load(specification_file)
+    games = specification["games"]
+    targets = {
+        REPOSITORY / f"{module_name}.py": {
+            block: generator(games[module_name]) for block, generator in MODULE_BLOCKS.items()
+        }
+        for module_name in options.games
+    }
+    stale: List[str] = []
+    for path, blocks in targets.items():
+        with open(path, encoding = "utf-8", newline = "") as source_file:
+            source = source_file.read()
+        generated = generate_blocks(source, blocks)
+        generated = generate_blocks(generated, {"engine": generate_engine(generated)})
+        if generated == source:
+            continue
+        stale.append(path.stem)
+        if not options.check:
+            with open(path, "w", encoding = "utf-8", newline = "") as source_file:
+                source_file.write(generated)
+    for name in stale:
+        print(f"{name} {'is out of date' if options.check else 'regenerated'}", file = sys.stderr)
+    return 1 if options.check and stale else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file